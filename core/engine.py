@@ -7,6 +7,7 @@ from typing import Optional
 from loguru import logger
 
 from .config import ConfigManager
+from .http_client import create_http_client
 from .scanner import WebScanner
 from .module_loader import ModuleLoader, BaseTestModule
 from .models import (
@@ -89,6 +90,8 @@ class TestEngine:
             config=self.config.config.model_dump()
         )
 
+        http_client = None
+
         try:
             # Phase 1: Web Scanning and Discovery
             logger.info("\n[Phase 1/3] Web Scanning and Discovery")
@@ -122,14 +125,17 @@ class TestEngine:
                 crawled_pages = []
                 api_endpoints = []
 
-            # Create test context
+            # Create test context; modules share one connection pool for the scan
+            http_client = create_http_client()
             context = TestContext(
                 target_url=self.config.config.target.url,
                 base_url=self.config.config.target.base_url or self.config.config.target.url,
                 crawled_pages=crawled_pages,
                 api_endpoints=api_endpoints,
                 cookies=self.config.config.target.cookies,
-                headers=self.config.config.target.headers
+                headers=self.config.config.target.headers,
+                response_cache=dict(self.scanner.responses),
+                http_client=http_client
             )
 
             # Phase 2: Module Discovery and Loading
@@ -232,6 +238,10 @@ class TestEngine:
 
             raise
 
+        finally:
+            if http_client is not None:
+                await http_client.aclose()
+
     async def _run_module(self, module: BaseTestModule, context: TestContext) -> ModuleResult:
         """
         Run a single test module
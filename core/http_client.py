@@ -0,0 +1,51 @@
+"""
+Shared HTTP client for test modules
+"""
+
+import ssl
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+import httpx
+
+try:
+    # httpx only negotiates HTTP/2 when the h2 package is installed
+    import h2  # noqa: F401
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+
+# Built once; creating an SSLContext per client re-initialises OpenSSL state.
+# Certificate checks are disabled for testing purposes.
+_SSL_CONTEXT = ssl.create_default_context()
+_SSL_CONTEXT.check_hostname = False
+_SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
+
+class _NoPersistCookiePolicy(DefaultCookiePolicy):
+    """Never store response cookies, so tests sharing a client stay isolated"""
+
+    def set_ok(self, cookie, request):
+        return False
+
+
+def create_http_client(timeout: float = 30) -> httpx.AsyncClient:
+    """
+    Create an HTTP client for test modules
+
+    One client is meant to be shared by all modules of a scan so connections
+    and TLS sessions are pooled; with h2 installed, concurrent requests to a
+    host are multiplexed over HTTP/2. Response cookies are never persisted.
+
+    Args:
+        timeout: Default request timeout in seconds
+
+    Returns:
+        Configured AsyncClient (caller is responsible for closing it)
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        verify=_SSL_CONTEXT,
+        http2=H2_AVAILABLE,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        cookies=CookieJar(policy=_NoPersistCookiePolicy())
+    )
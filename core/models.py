@@ -218,6 +218,8 @@ class CrawledPage(BaseModel):
     links: List[str] = Field(default_factory=list)
     inputs: List[Dict[str, Any]] = Field(default_factory=list)
     scripts: List[str] = Field(default_factory=list)
+    # Inline <script> bodies, on* handlers or javascript: URLs; None if not inspected
+    has_inline_js: Optional[bool] = None
     stylesheets: List[str] = Field(default_factory=list)
     meta_tags: Dict[str, str] = Field(default_factory=dict)
     headers: Dict[str, str] = Field(default_factory=dict)
@@ -248,3 +250,7 @@ class TestContext(BaseModel):
     headers: Dict[str, str] = Field(default_factory=dict)
     auth_token: Optional[str] = None
     session_data: Dict[str, Any] = Field(default_factory=dict)
+    # GET responses by URL, seeded by the crawler and shared by tests that only inspect them
+    response_cache: Dict[str, Any] = Field(default_factory=dict, exclude=True)
+    # Scan-wide httpx.AsyncClient owned by the engine; modules create their own when unset
+    http_client: Optional[Any] = Field(default=None, exclude=True)
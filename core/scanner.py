@@ -32,6 +32,8 @@ class WebScanner:
         self.crawled_urls: Set[str] = set()
         self.crawled_pages: List[CrawledPage] = []
         self.api_endpoints: List[ApiEndpoint] = []
+        # Raw responses of pages fetched this scan, handed to tests to avoid refetching
+        self.responses: Dict[str, httpx.Response] = {}
         self.base_url = config.config.target.url
         self.max_depth = config.config.crawler.max_depth
         self.max_pages = config.config.crawler.max_pages
@@ -181,6 +183,8 @@ class WebScanner:
                         page = await self._parse_response(
                             url, response, depth, parent_url, response_time
                         )
+                        if page:
+                            self.responses[url] = response
 
                         # Store in cache
                         if page and self.cache_enabled:
@@ -344,6 +348,8 @@ class WebScanner:
             for script in soup.find_all('script', src=True):
                 scripts.append(urljoin(url, script['src']))
 
+            has_inline_js = self._has_inline_js(soup)
+
             # Extract stylesheets
             stylesheets = []
             for link in soup.find_all('link', rel='stylesheet', href=True):
@@ -372,6 +378,7 @@ class WebScanner:
                 links=links,
                 inputs=inputs,
                 scripts=scripts,
+                has_inline_js=has_inline_js,
                 stylesheets=stylesheets,
                 meta_tags=meta_tags,
                 headers=dict(response.headers),
@@ -386,6 +393,25 @@ class WebScanner:
             logger.error(f"Error parsing response from {url}: {str(e)}")
             return None
 
+    @staticmethod
+    def _has_inline_js(soup: BeautifulSoup) -> bool:
+        """
+        Check whether a page carries JavaScript in its own markup
+
+        Args:
+            soup: Parsed page
+
+        Returns:
+            True if there is an inline script body, event handler attribute or javascript: URL
+        """
+        for tag in soup.find_all(True):
+            if tag.name == 'script' and not tag.get('src') and tag.string and tag.string.strip():
+                return True
+            for attr, value in tag.attrs.items():
+                if attr.startswith('on') or (isinstance(value, str) and value.lstrip().lower().startswith('javascript:')):
+                    return True
+        return False
+
     def _discover_api_endpoint(self, url: str, response: httpx.Response) -> None:
         """
         Discover and record API endpoint
@@ -25,6 +25,13 @@ import click
 from loguru import logger
 from rich.console import Console
 
+try:
+    # libuv-based event loop; not available on Windows
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Core imports
 from core import ConfigManager, TestEngine
 from core.notifier import Notifier
@@ -150,7 +157,8 @@ def main(
 
         progress.start()
         try:
-            scan_result = asyncio.run(engine.run())
+            run_loop = uvloop.run if UVLOOP_AVAILABLE else asyncio.run
+            scan_result = run_loop(engine.run())
         finally:
             progress.stop()
 
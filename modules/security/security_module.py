@@ -2,8 +2,11 @@
 Main Security Testing Module
 """
 
+from contextlib import AsyncExitStack
+
 from loguru import logger
 
+from core.http_client import create_http_client
 from core.module_loader import BaseTestModule
 from core.models import (
     Category, ModuleResult, TestResult, TestStatus, TestContext
@@ -78,28 +81,30 @@ class SecurityModule(BaseTestModule):
         # Get module configuration
         module_config = self.config.get_module_config(self.name)
 
-        # Run each test
-        for test_class in self.test_classes:
-            test_instance = test_class(self.config, module_config)
-
-            # Check if this specific test is enabled
-            if test_instance.is_enabled():
-                try:
-                    logger.debug(f"Running security test: {test_instance.name}")
-                    test_result = await test_instance.execute(context)
-                    module_result.add_test_result(test_result)
-                except Exception as e:
-                    logger.error(f"Error running {test_instance.name}: {str(e)}")
-                    # Create error test result
-                    error_result = TestResult(
-                        name=test_instance.name,
-                        description=test_instance.description,
-                        category=self.category,
-                        status=TestStatus.ERROR,
-                        error_message=str(e)
-                    )
-                    error_result.mark_completed(TestStatus.ERROR)
-                    module_result.add_test_result(error_result)
+        # All tests share one connection pool, the scan's when there is one
+        async with AsyncExitStack() as stack:
+            client = context.http_client or await stack.enter_async_context(create_http_client())
+            for test_class in self.test_classes:
+                test_instance = test_class(self.config, module_config, client=client)
+
+                # Check if this specific test is enabled
+                if test_instance.is_enabled():
+                    try:
+                        logger.debug("Running security test: {}", test_instance.name)
+                        test_result = await test_instance.execute(context)
+                        module_result.add_test_result(test_result)
+                    except Exception as e:
+                        logger.error(f"Error running {test_instance.name}: {str(e)}")
+                        # Create error test result
+                        error_result = TestResult(
+                            name=test_instance.name,
+                            description=test_instance.description,
+                            category=self.category,
+                            status=TestStatus.ERROR,
+                            error_message=str(e)
+                        )
+                        error_result.mark_completed(TestStatus.ERROR)
+                        module_result.add_test_result(error_result)
 
         module_result.mark_completed(TestStatus.PASSED)
         return module_result
@@ -2,17 +2,30 @@
 Base class for security tests
 """
 
+import asyncio
+import re
 from abc import abstractmethod
-from typing import Any, Dict
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 import httpx
 from loguru import logger
 
+from core.http_client import create_http_client
 from core.models import (
     TestResult, TestStatus, Category, Finding,
     Severity, Evidence, Recommendation, TestContext
 )
 
 
+_SEVERITY_EMOJI = {
+    Severity.CRITICAL: "🔴",
+    Severity.HIGH: "🟠",
+    Severity.MEDIUM: "🟡",
+    Severity.LOW: "🟢",
+    Severity.INFO: "ℹ️"
+}
+
+
 class BaseSecurityTest:
     """
     Base class for all security tests
@@ -22,16 +35,24 @@ class BaseSecurityTest:
     description: str = "Base security test"
     config_key: str = None  # Key in module config (e.g., 'sql_injection')
 
-    def __init__(self, config, module_config: Dict[str, Any]):
+    # Response bytes decoded for pattern scans; error messages appear early
+    MAX_SCAN_BYTES: int = 64 * 1024
+
+    # Read size when searching a streamed body
+    STREAM_CHUNK_BYTES: int = 64 * 1024
+
+    def __init__(self, config, module_config: Dict[str, Any], client: Optional[httpx.AsyncClient] = None):
         """
         Initialize security test
 
         Args:
             config: Global configuration
             module_config: Security module specific configuration
+            client: Shared HTTP client; a short-lived one is created per request if omitted
         """
         self.config = config
         self.module_config = module_config
+        self.client = client
         self.test_result = TestResult(
             name=self.name,
             description=self.description,
@@ -41,6 +62,13 @@ class BaseSecurityTest:
         self.timeout = 30
         self.max_retries = 3
 
+        # Caps in-flight requests so fan-out stays under server rate limits
+        self._request_semaphore = asyncio.Semaphore(self.get_config_value('max_concurrency', 20))
+
+        # Defaults are shared across requests; httpx never mutates them
+        self._default_headers = dict(self.config.config.target.headers)
+        self._default_cookies = dict(self.config.config.target.cookies)
+
     def is_enabled(self) -> bool:
         """
         Check if this test is enabled in configuration
@@ -63,7 +91,7 @@ class BaseSecurityTest:
         Returns:
             TestResult object
         """
-        logger.debug(f"Executing {self.name}")
+        logger.debug("Executing {}", self.name)
         self.test_result.status = TestStatus.RUNNING
 
         try:
@@ -74,7 +102,7 @@ class BaseSecurityTest:
                 self.test_result.mark_completed(TestStatus.PASSED)
 
         except Exception as e:
-            logger.error(f"Error in {self.name}: {str(e)}")
+            logger.exception("Error in {}", self.name)
             self.test_result.status = TestStatus.ERROR
             self.test_result.error_message = str(e)
             self.test_result.mark_completed(TestStatus.ERROR)
@@ -99,41 +127,193 @@ class BaseSecurityTest:
         data: Dict = None,
         headers: Dict = None,
         cookies: Dict = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        timeout: httpx.Timeout = None
     ) -> httpx.Response:
         """
         Make HTTP request with proper error handling
 
         Args:
             url: Target URL
-            method: HTTP method
+            method: HTTP method (HEAD falls back to a ranged GET when rejected)
             data: Request data
             headers: Request headers
             cookies: Request cookies
             allow_redirects: Whether to follow redirects
+            timeout: Per-request timeout overriding the client default
 
         Returns:
             HTTP response
         """
+        headers, cookies = self._with_defaults(headers, cookies)
+
+        if timeout is None:
+            timeout = httpx.USE_CLIENT_DEFAULT
+
+        async with self._request_semaphore:
+            if self.client is not None:
+                return await self._send(
+                    self.client, url, method, data, headers, cookies, allow_redirects, timeout
+                )
+
+            async with create_http_client(self.timeout) as client:
+                return await self._send(
+                    client, url, method, data, headers, cookies, allow_redirects, timeout
+                )
+
+    @asynccontextmanager
+    async def stream_request(
+        self,
+        url: str,
+        method: str = "GET",
+        data: Any = None,
+        headers: Dict = None,
+        cookies: Dict = None
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Send a request whose body is read only as far as the caller iterates it
+
+        Headers are available on entry; the connection is released on exit,
+        so a search can stop reading a large body at its first match.
+
+        Args:
+            url: Target URL
+            method: HTTP method
+            data: Request data
+            headers: Request headers
+            cookies: Request cookies
+
+        Yields:
+            Streaming HTTP response
+        """
+        headers, cookies = self._with_defaults(headers, cookies)
+
+        async with self._request_semaphore, AsyncExitStack() as stack:
+            client = self.client or await stack.enter_async_context(create_http_client(self.timeout))
+            async with client.stream(
+                method, url, data=data, headers=headers, cookies=cookies or None, follow_redirects=True
+            ) as response:
+                yield response
+
+    async def search_stream(
+        self,
+        response: httpx.Response,
+        pattern: re.Pattern,
+        overlap: int
+    ) -> Optional[bytes]:
+        """
+        Search a streamed body chunk by chunk, stopping at the first match
+
+        Args:
+            response: Response opened with stream_request
+            pattern: Bytes pattern to search for
+            overlap: Bytes carried between chunks so matches spanning a chunk
+                boundary are found; at least the longest match minus one
+
+        Returns:
+            Body excerpt around the first match, or None if nothing matched
+        """
+        tail = b''
+        async for chunk in response.aiter_bytes(self.STREAM_CHUNK_BYTES):
+            window = tail + chunk
+            match = pattern.search(window)
+            if match:
+                return window[max(0, match.start() - 200):match.end() + 200]
+            tail = window[-overlap:] if overlap else b''
+        return None
+
+    def _with_defaults(self, headers: Optional[Dict], cookies: Optional[Dict]) -> Tuple[Dict, Dict]:
+        """Merge per-request headers and cookies over the configured defaults"""
         if headers is None:
-            headers = self.config.config.target.headers.copy()
+            headers = self._default_headers
+        else:
+            headers = {**self._default_headers, **headers}
 
         if cookies is None:
-            cookies = self.config.config.target.cookies.copy()
+            cookies = self._default_cookies
+        else:
+            cookies = {**self._default_cookies, **cookies}
 
-        async with httpx.AsyncClient(
-            timeout=self.timeout,
+        return headers, cookies
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        method: str,
+        data: Dict,
+        headers: Dict,
+        cookies: Dict,
+        allow_redirects: bool,
+        timeout
+    ) -> httpx.Response:
+        """Send a request on the given client"""
+        response = await client.request(
+            method=method,
+            url=url,
+            data=data,
+            headers=headers,
+            cookies=cookies or None,
             follow_redirects=allow_redirects,
-            verify=False  # For testing purposes
-        ) as client:
+            timeout=timeout
+        )
+
+        # Servers that reject HEAD get a GET for the first byte only
+        if method == "HEAD" and response.status_code in (405, 501):
             response = await client.request(
-                method=method,
+                method="GET",
                 url=url,
                 data=data,
-                headers=headers,
-                cookies=cookies
+                headers={**headers, 'Range': 'bytes=0-0'},
+                cookies=cookies or None,
+                follow_redirects=allow_redirects,
+                timeout=timeout
             )
-            return response
+        return response
+
+    def get_scan_text(self, response: httpx.Response) -> str:
+        """
+        Decode the start of a response body for pattern scanning
+
+        Only the first MAX_SCAN_BYTES are decoded, so large pages are not
+        converted to text in full just to be searched.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Decoded body prefix
+        """
+        body = response.content[:self.MAX_SCAN_BYTES]
+        return body.decode(response.encoding or 'utf-8', errors='replace')
+
+    async def get_cached_response(self, url: str, context: TestContext) -> httpx.Response:
+        """
+        Get the GET response for a URL, reusing the crawler's or an earlier test's fetch
+
+        Args:
+            url: URL to fetch
+            context: Test context
+
+        Returns:
+            HTTP response
+        """
+        response = context.response_cache.get(url)
+        if response is None:
+            response = context.response_cache[url] = await self.make_request(url)
+        return response
+
+    async def get_baseline_response(self, context: TestContext) -> httpx.Response:
+        """
+        Get the GET response for the target URL, fetching it only once per scan
+
+        Args:
+            context: Test context
+
+        Returns:
+            HTTP response
+        """
+        return await self.get_cached_response(context.target_url, context)
 
     def add_finding(
         self,
@@ -176,15 +356,13 @@ class BaseSecurityTest:
 
         self.test_result.add_finding(finding)
 
-        # Log the finding
-        severity_emoji = {
-            Severity.CRITICAL: "🔴",
-            Severity.HIGH: "🟠",
-            Severity.MEDIUM: "🟡",
-            Severity.LOW: "🟢",
-            Severity.INFO: "ℹ️"
-        }
-        logger.warning(f"{severity_emoji.get(severity, '')} Found: {title} ({severity.value})")
+        # Log the finding; formatting is deferred until loguru emits it
+        logger.opt(lazy=True).warning(
+            "{} Found: {} ({})",
+            lambda: _SEVERITY_EMOJI.get(severity, ''),
+            lambda: title,
+            lambda: severity.value
+        )
 
     def create_evidence(self, evidence_type: str, data: Any, description: str = None) -> Evidence:
         """
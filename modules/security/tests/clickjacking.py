@@ -10,7 +10,7 @@ class ClickjackingTest(BaseSecurityTest):
     config_key = "clickjacking"
 
     async def run_test(self, context: TestContext) -> None:
-        response = await self.make_request(context.target_url)
+        response = await self.get_baseline_response(context)
 
         x_frame = response.headers.get('X-Frame-Options', '').upper()
         csp = response.headers.get('Content-Security-Policy', '').lower()
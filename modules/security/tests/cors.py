@@ -1,5 +1,7 @@
 """CORS Misconfiguration Testing"""
 
+import asyncio
+
 from core.models import TestContext, Severity
 from .base_security_test import BaseSecurityTest
 
@@ -12,12 +14,17 @@ class CORSTest(BaseSecurityTest):
     async def run_test(self, context: TestContext) -> None:
         malicious_origins = ['http://evil.com', 'null']
 
-        for origin in malicious_origins:
-            response = await self.make_request(
+        # Probes are independent, so send them concurrently
+        responses = await asyncio.gather(*(
+            self.make_request(
                 context.target_url,
+                method='HEAD',
                 headers={'Origin': origin}
             )
+            for origin in malicious_origins
+        ))
 
+        for origin, response in zip(malicious_origins, responses):
             acao = response.headers.get('Access-Control-Allow-Origin', '')
             acac = response.headers.get('Access-Control-Allow-Credentials', '')
 
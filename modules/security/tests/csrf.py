@@ -4,6 +4,7 @@ Cross-Site Request Forgery (CSRF) Testing
 
 from core.models import TestContext, Severity
 from .base_security_test import BaseSecurityTest
+from .param_keywords import PARAM_KEYWORDS, classify_param_name
 from loguru import logger
 
 
@@ -14,7 +15,7 @@ class CSRFTest(BaseSecurityTest):
     description = "Tests for Cross-Site Request Forgery (CSRF) vulnerabilities"
     config_key = "csrf"
 
-    CSRF_TOKEN_NAMES = ['csrf', 'csrf_token', 'token', '_token', 'xsrf', 'authenticity_token']
+    CSRF_TOKEN_NAMES = list(PARAM_KEYWORDS['csrf'])
 
     async def run_test(self, context: TestContext) -> None:
         """Run CSRF tests"""
@@ -37,8 +38,7 @@ class CSRFTest(BaseSecurityTest):
 
         # Check if form has CSRF token
         for inp in inputs:
-            name = inp.get('name', '').lower()
-            if any(token_name in name for token_name in self.CSRF_TOKEN_NAMES):
+            if 'csrf' in classify_param_name(inp.get('name', '')):
                 has_csrf_token = True
                 break
 
@@ -86,4 +86,4 @@ class CSRFTest(BaseSecurityTest):
                     )
 
             except Exception as e:
-                logger.debug(f"Error testing CSRF: {str(e)}")
+                logger.debug("Error testing CSRF: {}", e)
@@ -2,7 +2,10 @@
 
 from core.models import TestContext, Severity
 from .base_security_test import BaseSecurityTest
-from urllib.parse import parse_qs, urlparse
+from .param_keywords import classify_param_name
+import re
+from itertools import islice
+from urllib.parse import parse_qs, quote, urlencode, urlparse, urlsplit, urlunsplit
 
 
 class OpenRedirectTest(BaseSecurityTest):
@@ -18,26 +21,33 @@ class OpenRedirectTest(BaseSecurityTest):
     ]
 
     async def run_test(self, context: TestContext) -> None:
-        for page in context.crawled_pages[:20]:
-            parsed = urlparse(page.url)
-            if parsed.query:
-                params = parse_qs(parsed.query)
-                for param in params:
-                    if any(k in param.lower() for k in ['url', 'redirect', 'return', 'next', 'goto', 'redir']):
-                        await self._test_open_redirect(page.url, param)
+        # Parse each URL once and only keep pages that carry a query string
+        pages_with_query = (
+            (page, query) for page in context.crawled_pages
+            if (query := urlparse(page.url).query)
+        )
+        for page, query in islice(pages_with_query, 20):
+            for param in parse_qs(query):
+                if 'redirect' in classify_param_name(param):
+                    await self._test_open_redirect(page.url, param)
 
     async def _test_open_redirect(self, url: str, param: str) -> None:
+        parts = urlsplit(url)
+        # Rewrite only the targeted value so ordering and encoding of the
+        # remaining parameters are preserved
+        param_re = re.compile(rf'(^|&){re.escape(param)}=[^&]*')
+
         for payload in self.PAYLOADS[:2]:
             try:
-                parsed = urlparse(url)
-                params = parse_qs(parsed.query)
-                params[param] = payload
-
-                from urllib.parse import urlencode, urlunparse
-                test_url = urlunparse((
-                    parsed.scheme, parsed.netloc, parsed.path,
-                    parsed.params, urlencode(params, doseq=True), ''
-                ))
+                replacement = f'{quote(param)}={quote(payload, safe="")}'
+                query, replaced = param_re.subn(lambda m: m.group(1) + replacement, parts.query, count=1)
+                if not replaced:
+                    # The name is encoded differently in the raw query (e.g.
+                    # %5F or +), so rebuild the whole query from parsed values
+                    params = parse_qs(parts.query)
+                    params[param] = payload
+                    query = urlencode(params, doseq=True)
+                test_url = urlunsplit((parts.scheme, parts.netloc, parts.path, query, ''))
 
                 response = await self.make_request(test_url, allow_redirects=False)
 
@@ -0,0 +1,42 @@
+"""
+Shared input-name keyword classification for security tests
+"""
+
+import re
+from functools import lru_cache
+from typing import FrozenSet
+
+# Keywords that mark an input name as interesting for a given test category
+PARAM_KEYWORDS = {
+    'cmd': ('file', 'path', 'cmd', 'command', 'exec', 'system'),
+    'path': ('file', 'path', 'dir', 'folder'),
+    'redirect': ('url', 'redirect', 'return', 'next', 'goto', 'redir'),
+    'ssrf': ('url', 'uri', 'link', 'callback', 'webhook'),
+    'csrf': ('csrf', 'csrf_token', 'token', '_token', 'xsrf', 'authenticity_token'),
+}
+
+_CATEGORY_PATTERNS = {
+    category: re.compile('|'.join(map(re.escape, keywords)))
+    for category, keywords in PARAM_KEYWORDS.items()
+}
+
+
+@lru_cache(maxsize=4096)
+def classify_param_name(name: str) -> FrozenSet[str]:
+    """
+    Get the keyword categories an input name belongs to
+
+    Results are cached, so each distinct name is scanned once per process
+    no matter how many pages, forms or tests see it.
+
+    Args:
+        name: Input or query parameter name
+
+    Returns:
+        Set of matching categories (e.g. {'cmd', 'path'})
+    """
+    lowered = name.lower()
+    return frozenset(
+        category for category, pattern in _CATEGORY_PATTERNS.items()
+        if pattern.search(lowered)
+    )
@@ -2,7 +2,9 @@
 
 from core.models import TestContext, Severity
 from .base_security_test import BaseSecurityTest
+from .param_keywords import classify_param_name
 from loguru import logger
+from itertools import islice
 
 
 class PathTraversalTest(BaseSecurityTest):
@@ -18,18 +20,18 @@ class PathTraversalTest(BaseSecurityTest):
     ]
 
     async def run_test(self, context: TestContext) -> None:
-        for page in context.crawled_pages[:10]:
+        for page in islice((p for p in context.crawled_pages if p.forms), 10):
             for form in page.forms:
                 for inp in form.get('inputs', []):
-                    if any(k in inp.get('name', '').lower() for k in ['file', 'path', 'dir', 'folder']):
+                    if 'path' in classify_param_name(inp.get('name', '')):
                         await self._test_lfi(form, page.url, inp['name'])
 
     async def _test_lfi(self, form: dict, page_url: str, param: str) -> None:
         url = form.get('action') or page_url
+        data = {inp['name']: 'test' for inp in form.get('inputs', []) if inp.get('name')}
         for payload in self.PAYLOADS[:2]:
             try:
-                data = {inp['name']: payload if inp['name'] == param else 'test'
-                       for inp in form.get('inputs', []) if inp.get('name')}
+                data[param] = payload
                 response = await self.make_request(url, method=form.get('method', 'GET'), data=data)
 
                 if 'root:' in response.text or '[extensions]' in response.text:
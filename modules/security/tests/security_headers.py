@@ -20,13 +20,14 @@ class SecurityHeadersTest(BaseSecurityTest):
     }
 
     async def run_test(self, context: TestContext) -> None:
-        response = await self.make_request(context.target_url)
-        headers = {k.lower(): v for k, v in response.headers.items()}
+        response = await self.get_baseline_response(context)
+        # httpx.Headers already matches names case-insensitively
+        headers = response.headers
 
         for header_name, expected_values in self.REQUIRED_HEADERS.items():
-            header_key = header_name.lower()
+            header_value = headers.get(header_name)
 
-            if header_key not in headers:
+            if header_value is None:
                 severity = Severity.MEDIUM if header_name in ['Permissions-Policy', 'Referrer-Policy'] else Severity.HIGH
 
                 self.add_finding(
@@ -44,11 +45,11 @@ class SecurityHeadersTest(BaseSecurityTest):
                     cwe_id="CWE-16"
                 )
             elif expected_values:
-                header_value = headers[header_key].lower()
-                if not any(exp.lower() in header_value for exp in expected_values):
+                value = header_value.lower()
+                if not any(exp.lower() in value for exp in expected_values):
                     self.add_finding(
                         title=f"Weak Security Header: {header_name}",
-                        description=f"{header_name} is set but with weak value: {headers[header_key]}",
+                        description=f"{header_name} is set but with weak value: {header_value}",
                         severity=Severity.LOW,
                         url=context.target_url,
                         cwe_id="CWE-16"
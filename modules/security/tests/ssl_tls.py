@@ -1,17 +1,24 @@
 """SSL/TLS Testing"""
 
+import asyncio
+import contextlib
 import ssl
-import socket
 from urllib.parse import urlparse
 from core.models import TestContext, Severity
 from .base_security_test import BaseSecurityTest
 
+# Loading the CA bundle is expensive, so build the verifying context once
+_DEFAULT_SSL_CONTEXT = ssl.create_default_context()
+
 
 class SSLTLSTest(BaseSecurityTest):
     name = "ssl_tls"
     description = "Tests SSL/TLS configuration"
     config_key = "ssl_tls"
 
+    # Seconds to wait for the server to acknowledge closing the connection
+    CLOSE_TIMEOUT = 5
+
     async def run_test(self, context: TestContext) -> None:
         parsed = urlparse(context.target_url)
 
@@ -29,22 +36,30 @@ class SSLTLSTest(BaseSecurityTest):
         port = parsed.port or 443
 
         try:
-            # Check SSL certificate
-            ctx = ssl.create_default_context()
-            with socket.create_connection((hostname, port), timeout=10) as sock:
-                with ctx.wrap_socket(sock, server_hostname=hostname) as ssock:
-                    cert = ssock.getpeercert()
-                    version = ssock.version()
-
-                    # Check TLS version
-                    if version in ['TLSv1', 'TLSv1.1', 'SSLv2', 'SSLv3']:
-                        self.add_finding(
-                            title="Weak TLS Version",
-                            description=f"Server uses outdated {version}",
-                            severity=Severity.HIGH,
-                            url=context.target_url,
-                            cwe_id="CWE-327"
-                        )
+            # Check SSL certificate without blocking the event loop
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    hostname, port, ssl=_DEFAULT_SSL_CONTEXT, server_hostname=hostname
+                ),
+                timeout=10
+            )
+            try:
+                version = writer.get_extra_info('ssl_object').version()
+            finally:
+                writer.close()
+                # Finish the TLS shutdown; servers that never answer it are not an error
+                with contextlib.suppress(Exception):
+                    await asyncio.wait_for(writer.wait_closed(), timeout=self.CLOSE_TIMEOUT)
+
+            # Check TLS version
+            if version in ['TLSv1', 'TLSv1.1', 'SSLv2', 'SSLv3']:
+                self.add_finding(
+                    title="Weak TLS Version",
+                    description=f"Server uses outdated {version}",
+                    severity=Severity.HIGH,
+                    url=context.target_url,
+                    cwe_id="CWE-327"
+                )
 
         except ssl.SSLCertVerificationError as e:
             self.add_finding(
@@ -1,7 +1,10 @@
 """Server-Side Request Forgery (SSRF) Testing"""
 
+import re
+
 from core.models import TestContext, Severity
 from .base_security_test import BaseSecurityTest
+from .param_keywords import classify_param_name
 from loguru import logger
 
 
@@ -24,6 +27,9 @@ class SSRFTest(BaseSecurityTest):
         'gopher://localhost:3306',
     ]
 
+    # Case-insensitive, so the response body is not lower-cased first
+    SUCCESS_INDICATOR_REGEX = re.compile(r'root:|ami-id|instance-id|metadata', re.IGNORECASE)
+
     async def run_test(self, context: TestContext) -> None:
         """Run SSRF tests"""
 
@@ -31,8 +37,7 @@ class SSRFTest(BaseSecurityTest):
             # Look for URL parameters
             for form in page.forms:
                 for inp in form.get('inputs', []):
-                    name = inp.get('name', '').lower()
-                    if any(keyword in name for keyword in ['url', 'uri', 'link', 'callback', 'webhook']):
+                    if 'ssrf' in classify_param_name(inp.get('name', '')):
                         await self._test_ssrf_parameter(form, page.url, inp['name'])
 
     async def _test_ssrf_parameter(self, form: dict, page_url: str, param_name: str) -> None:
@@ -63,9 +68,8 @@ class SSRFTest(BaseSecurityTest):
                     )
 
             except Exception as e:
-                logger.debug(f"Error testing SSRF: {str(e)}")
+                logger.debug("Error testing SSRF: {}", e)
 
     def _check_ssrf_success(self, response_text: str, payload: str) -> bool:
         """Check if SSRF was successful"""
-        indicators = ['root:', 'ami-id', 'instance-id', 'metadata']
-        return any(ind in response_text.lower() for ind in indicators)
+        return self.SUCCESS_INDICATOR_REGEX.search(response_text) is not None
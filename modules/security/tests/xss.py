@@ -5,13 +5,51 @@ Tests for reflected, stored, and DOM-based XSS vulnerabilities
 
 import asyncio
 import re
-from typing import List, Dict
+import uuid
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 from urllib.parse import urlencode, parse_qs, urlparse
 from loguru import logger
 
 from core.models import TestContext, Severity
 from .base_security_test import BaseSecurityTest
 
+try:
+    # Linear-time DFA matching for attacker-controlled bodies
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Markup fragments that execute script when reflected without encoding
+DANGEROUS_PARTS = (b'<script', b'onerror', b'onload', b'javascript:', b'alert(')
+
+
+@lru_cache(maxsize=256)
+def _reflection_pattern(payload: str) -> Tuple[re.Pattern, int]:
+    """
+    Compile what counts as an unencoded reflection of a payload
+
+    That is any dangerous fragment the payload carries (an exact echo
+    contains them too), or the payload itself if it has none. Cached per
+    payload; matched on raw bytes, so bodies are neither decoded nor
+    lower-cased before scanning.
+
+    Args:
+        payload: XSS payload
+
+    Returns:
+        Bytes pattern, and the overlap search_stream needs between chunks
+    """
+    payload_bytes = payload.encode('utf-8')
+    payload_lower = payload_bytes.lower()
+    parts = [part for part in DANGEROUS_PARTS if part in payload_lower]
+    if not parts:
+        return re.compile(re.escape(payload_bytes)), len(payload_bytes) - 1
+    # RE2 takes no re flags, so case-insensitivity is inline
+    pattern = (re2 if RE2_AVAILABLE else re).compile(b'(?i)' + b'|'.join(map(re.escape, parts)))
+    return pattern, max(map(len, parts)) - 1
+
 
 class XSSTest(BaseSecurityTest):
     """
@@ -69,6 +107,16 @@ class XSSTest(BaseSecurityTest):
         'document.writeln(',
         '.insertAdjacentHTML',
     ]
+    # Sources and sinks in one alternation, anchored at identifier boundaries
+    # so e.g. 'relocation' or 'retrieval(' do not match. Stays on re, as RE2
+    # has no lookaround; fixed literals with fixed-width guards cannot backtrack
+    DOM_XSS_TOKEN_REGEX = re.compile('|'.join(
+        ('' if token.startswith('.') else r'(?<![\w$])')
+        + re.escape(token)
+        + ('' if token.endswith('(') else r'(?![\w$])')
+        for token in DOM_XSS_SOURCES + DOM_XSS_SINKS
+    ))
+    DOM_XSS_SINK_SET = frozenset(DOM_XSS_SINKS)
 
     async def run_test(self, context: TestContext) -> None:
         """Run XSS tests"""
@@ -106,7 +154,8 @@ class XSSTest(BaseSecurityTest):
                     test_targets.append({
                         'type': 'url_param',
                         'url': page.url,
-                        'params': params
+                        'params': params,
+                        'url_prefixes': self._url_prefixes(page.url, params)
                     })
 
             # Test forms
@@ -116,81 +165,160 @@ class XSSTest(BaseSecurityTest):
                         'type': 'form',
                         'url': form.get('action') or page.url,
                         'method': form.get('method', 'GET'),
-                        'inputs': form.get('inputs', [])
+                        'inputs': form.get('inputs', []),
+                        'input_names': tuple(inp['name'] for inp in form['inputs'] if inp.get('name'))
                     })
 
-        # Test each target with payloads
-        for target in test_targets[:30]:  # Limit testing
-            await self._test_target_for_xss(target, context)
+        # Site-wide forms and repeated parameter sets would otherwise use up
+        # the limit below on duplicates
+        test_targets = self._deduplicate_targets(test_targets)
+
+        # Test each target with payloads; make_request bounds the concurrency
+        await asyncio.gather(
+            *(self._test_target_for_xss(target, context) for target in test_targets[:30]),  # Limit testing
+            return_exceptions=True
+        )
+
+    def _deduplicate_targets(self, test_targets: List[Dict]) -> List[Dict]:
+        """
+        Remove targets that would send identical requests
+
+        Forms are keyed by action URL, method and input names; URL
+        parameters by page path and parameter names.
+
+        Args:
+            test_targets: Targets in discovery order
+
+        Returns:
+            Unique targets, keeping the first occurrence
+        """
+        seen = set()
+        unique_targets = []
+
+        for target in test_targets:
+            if target['type'] == 'form':
+                key = (target['type'], target['url'], target['method'].upper(), frozenset(target['input_names']))
+            else:
+                key = (target['type'], target['url'].split('?')[0], frozenset(target['params']))
+
+            if key not in seen:
+                seen.add(key)
+                unique_targets.append(target)
+
+        return unique_targets
+
+    @staticmethod
+    def _url_prefixes(url: str, params: Dict[str, List[str]]) -> Dict[str, str]:
+        """
+        Build each parameter's test URL up to its own value
+
+        The untouched parameters are encoded once here instead of for every payload.
+
+        Args:
+            url: Page URL
+            params: Parsed query parameters
+
+        Returns:
+            Mapping of parameter name to URL prefix ending where its encoded pair goes
+        """
+        base = url.split('?')[0]
+        prefixes = {}
+        for param_name in params:
+            others = urlencode({k: v for k, v in params.items() if k != param_name}, doseq=True)
+            prefixes[param_name] = f"{base}?{others}&" if others else f"{base}?"
+        return prefixes
 
     async def _test_target_for_xss(self, target: Dict, context: TestContext) -> None:
         """Test a specific target for XSS"""
 
-        url = target['url']
+        payloads = self.XSS_PAYLOADS[:5]  # Use subset of payloads
 
-        for payload in self.XSS_PAYLOADS[:5]:  # Use subset of payloads
-            try:
-                if target['type'] == 'form':
-                    method = target.get('method', 'GET').upper()
-                    data = {inp['name']: payload for inp in target.get('inputs', []) if inp.get('name')}
+        if target['type'] == 'form':
+            probes = [(None, payload) for payload in payloads]
+        else:
+            probes = [(param_name, payload)
+                      for payload in payloads
+                      for param_name in target.get('params', {})]
 
-                    response = await self.make_request(url, method=method, data=data)
+        await asyncio.gather(*(self._probe_xss(target, *probe) for probe in probes))
 
-                elif target['type'] == 'url_param':
-                    params = target.get('params', {})
-                    for param_name in params:
-                        test_params = params.copy()
-                        test_params[param_name] = payload
+    async def _probe_xss(self, target: Dict, param_name: Optional[str], payload: str) -> None:
+        """
+        Send one XSS payload and report it if reflected
 
-                        test_url = f"{url.split('?')[0]}?{urlencode(test_params, doseq=True)}"
-                        response = await self.make_request(test_url, method='GET')
+        Args:
+            target: Target information (form or URL params)
+            param_name: Parameter to inject, or None to fill every form input
+            payload: XSS payload
+        """
+        url = target['url']
 
-                        # Check if payload is reflected in response
-                        if self._check_xss_reflection(payload, response.text):
-                            self.add_finding(
-                                title="Reflected Cross-Site Scripting (XSS) Vulnerability",
-                                description=f"Reflected XSS vulnerability detected in parameter '{param_name}'. "
-                                          f"User input is reflected in the response without proper sanitization, "
-                                          f"allowing execution of malicious JavaScript code.",
-                                severity=Severity.HIGH,
-                                url=test_url,
-                                evidence=[
-                                    self.create_evidence(
-                                        "request",
-                                        f"GET {test_url}\nPayload: {payload}",
-                                        "Request with XSS payload"
-                                    ),
-                                    self.create_evidence(
-                                        "response",
-                                        response.text[:500],
-                                        "Response reflecting XSS payload"
-                                    )
-                                ],
-                                recommendations=[
-                                    self.create_recommendation(
-                                        "Implement Output Encoding",
-                                        "Encode all user-supplied data before rendering in HTML context. "
-                                        "Use context-appropriate encoding (HTML, JavaScript, URL, CSS).",
-                                        references=[
-                                            "https://owasp.org/www-community/attacks/xss/",
-                                            "https://cheatsheetseries.owasp.org/cheatsheets/Cross_Site_Scripting_Prevention_Cheat_Sheet.html"
-                                        ],
-                                        code_example="# Python example\nfrom html import escape\nsafe_output = escape(user_input)"
-                                    ),
-                                    self.create_recommendation(
-                                        "Implement Content Security Policy (CSP)",
-                                        "Use CSP headers to restrict sources of executable scripts.",
-                                        code_example="Content-Security-Policy: default-src 'self'; script-src 'self'"
-                                    )
-                                ],
-                                cwe_id="CWE-79",
-                                owasp_category="A03:2021-Injection",
-                                parameter=param_name,
-                                payload=payload
-                            )
+        if param_name is None:
+            method = target.get('method', 'GET').upper()
+            data = dict.fromkeys(target['input_names'], payload)
+            param_name = ', '.join(data)
+            test_url = url
+        else:
+            method = 'GET'
+            data = None
+            test_url = target['url_prefixes'][param_name] + urlencode({param_name: payload})
 
-            except Exception as e:
-                logger.debug(f"Error testing XSS on {url}: {str(e)}")
+        try:
+            async with self.stream_request(test_url, method=method, data=data) as response:
+                # Only markup can execute a reflected payload; skip reading other bodies.
+                # Error statuses are still checked, as error pages often echo input
+                content_type = response.headers.get('content-type', '').lower()
+                if content_type and 'html' not in content_type:
+                    return
+
+                # Check if payload is reflected, reading no further than the first hit
+                excerpt = await self.search_stream(response, *_reflection_pattern(payload))
+        except Exception as e:
+            logger.debug("Error testing XSS on {}: {}", url, e)
+            return
+
+        if excerpt is not None:
+            self.add_finding(
+                title="Reflected Cross-Site Scripting (XSS) Vulnerability",
+                description=f"Reflected XSS vulnerability detected in parameter '{param_name}'. "
+                          f"User input is reflected in the response without proper sanitization, "
+                          f"allowing execution of malicious JavaScript code.",
+                severity=Severity.HIGH,
+                url=test_url,
+                evidence=[
+                    self.create_evidence(
+                        "request",
+                        f"{method} {test_url}\nPayload: {payload}",
+                        "Request with XSS payload"
+                    ),
+                    self.create_evidence(
+                        "response",
+                        excerpt.decode('utf-8', errors='replace'),
+                        "Response reflecting XSS payload"
+                    )
+                ],
+                recommendations=[
+                    self.create_recommendation(
+                        "Implement Output Encoding",
+                        "Encode all user-supplied data before rendering in HTML context. "
+                        "Use context-appropriate encoding (HTML, JavaScript, URL, CSS).",
+                        references=[
+                            "https://owasp.org/www-community/attacks/xss/",
+                            "https://cheatsheetseries.owasp.org/cheatsheets/Cross_Site_Scripting_Prevention_Cheat_Sheet.html"
+                        ],
+                        code_example="# Python example\nfrom html import escape\nsafe_output = escape(user_input)"
+                    ),
+                    self.create_recommendation(
+                        "Implement Content Security Policy (CSP)",
+                        "Use CSP headers to restrict sources of executable scripts.",
+                        code_example="Content-Security-Policy: default-src 'self'; script-src 'self'"
+                    )
+                ],
+                cwe_id="CWE-79",
+                owasp_category="A03:2021-Injection",
+                parameter=param_name,
+                payload=payload
+            )
 
     async def _test_dom_xss(self, context: TestContext) -> None:
         """Test for DOM-based XSS vulnerabilities"""
@@ -198,45 +326,48 @@ class XSSTest(BaseSecurityTest):
         logger.info("Testing for DOM-based XSS")
 
         for page in context.crawled_pages:
-            # Get all JavaScript sources
             try:
-                response = await self.make_request(page.url)
-                html_content = response.text
-
-                # Check for DOM XSS patterns in inline scripts
-                if self._check_dom_xss_patterns(html_content):
-                    self.add_finding(
-                        title="Potential DOM-based XSS Vulnerability",
-                        description="The page contains JavaScript code that uses potentially dangerous "
-                                  "DOM sources (like location.href) and sinks (like innerHTML) which "
-                                  "could lead to DOM-based XSS if not properly sanitized.",
-                        severity=Severity.MEDIUM,
-                        url=page.url,
-                        evidence=[
-                            self.create_evidence(
-                                "javascript",
-                                "DOM XSS patterns detected in JavaScript code",
-                                "Potentially vulnerable code patterns"
-                            )
-                        ],
-                        recommendations=[
-                            self.create_recommendation(
-                                "Sanitize DOM Sources",
-                                "Always sanitize data from DOM sources before using in sinks. "
-                                "Use textContent instead of innerHTML when possible.",
-                                code_example="// Bad\nelement.innerHTML = location.hash;\n\n// Good\nelement.textContent = location.hash;"
-                            )
-                        ],
-                        cwe_id="CWE-79",
-                        owasp_category="A03:2021-Injection"
-                    )
-
-                # Also check external scripts
-                for script_url in page.scripts:
-                    await self._check_external_script_for_dom_xss(script_url, page.url)
+                # Pages the crawler saw without inline JS have nothing to fetch and scan
+                if page.has_inline_js is not False:
+                    response = await self.get_cached_response(page.url, context)
+                    html_content = response.text
+
+                    # Check for DOM XSS patterns in inline scripts
+                    if self._check_dom_xss_patterns(html_content):
+                        self.add_finding(
+                            title="Potential DOM-based XSS Vulnerability",
+                            description="The page contains JavaScript code that uses potentially dangerous "
+                                      "DOM sources (like location.href) and sinks (like innerHTML) which "
+                                      "could lead to DOM-based XSS if not properly sanitized.",
+                            severity=Severity.MEDIUM,
+                            url=page.url,
+                            evidence=[
+                                self.create_evidence(
+                                    "javascript",
+                                    "DOM XSS patterns detected in JavaScript code",
+                                    "Potentially vulnerable code patterns"
+                                )
+                            ],
+                            recommendations=[
+                                self.create_recommendation(
+                                    "Sanitize DOM Sources",
+                                    "Always sanitize data from DOM sources before using in sinks. "
+                                    "Use textContent instead of innerHTML when possible.",
+                                    code_example="// Bad\nelement.innerHTML = location.hash;\n\n// Good\nelement.textContent = location.hash;"
+                                )
+                            ],
+                            cwe_id="CWE-79",
+                            owasp_category="A03:2021-Injection"
+                        )
+
+                # Also check external scripts, concurrently; make_request bounds the fan-out
+                await asyncio.gather(
+                    *(self._check_external_script_for_dom_xss(script_url, page.url) for script_url in page.scripts),
+                    return_exceptions=True
+                )
 
             except Exception as e:
-                logger.debug(f"Error testing DOM XSS on {page.url}: {str(e)}")
+                logger.debug("Error testing DOM XSS on {}: {}", page.url, e)
 
     async def _test_stored_xss(self, context: TestContext) -> None:
         """Test for stored XSS vulnerabilities"""
@@ -253,8 +384,9 @@ class XSSTest(BaseSecurityTest):
                     url = form.get('action') or page.url
                     inputs = form.get('inputs', [])
 
-                    # Submit form with XSS payload
-                    payload = "<script>alert('Stored-XSS')</script>"
+                    # Submit form with a uniquely tagged payload, so markup already
+                    # on the page can't be mistaken for our submission
+                    payload = f"<script>alert('{uuid.uuid4().hex}')</script>"
                     data = {}
 
                     for inp in inputs:
@@ -269,8 +401,8 @@ class XSSTest(BaseSecurityTest):
                         # Submit the form
                         response = await self.make_request(url, method=method, data=data)
 
-                        # Check if payload is in response (might be stored)
-                        if payload in response.text or self._check_xss_reflection(payload, response.text):
+                        # Check if payload is in response unencoded (might be stored)
+                        if payload.encode('utf-8') in response.content:
                             self.add_finding(
                                 title="Potential Stored XSS Vulnerability",
                                 description="The application appears to store user input and display it "
@@ -283,30 +415,7 @@ class XSSTest(BaseSecurityTest):
                             )
 
                     except Exception as e:
-                        logger.debug(f"Error testing stored XSS: {str(e)}")
-
-    def _check_xss_reflection(self, payload: str, response_text: str) -> bool:
-        """
-        Check if XSS payload is reflected in response
-
-        Args:
-            payload: XSS payload
-            response_text: HTTP response text
-
-        Returns:
-            True if payload is reflected without encoding
-        """
-        # Check for exact match
-        if payload in response_text:
-            return True
-
-        # Check for partially reflected payload (without encoding)
-        dangerous_parts = ['<script', 'onerror', 'onload', 'javascript:', 'alert(']
-        for part in dangerous_parts:
-            if part.lower() in payload.lower() and part.lower() in response_text.lower():
-                return True
-
-        return False
+                        logger.debug("Error testing stored XSS: {}", e)
 
     def _check_dom_xss_patterns(self, javascript_code: str) -> bool:
         """
@@ -318,11 +427,17 @@ class XSSTest(BaseSecurityTest):
         Returns:
             True if DOM XSS patterns found
         """
-        # Check for sources and sinks
-        has_source = any(source in javascript_code for source in self.DOM_XSS_SOURCES)
-        has_sink = any(sink in javascript_code for sink in self.DOM_XSS_SINKS)
+        # Check for sources and sinks in one pass, stopping once both are seen
+        has_source = has_sink = False
+        for match in self.DOM_XSS_TOKEN_REGEX.finditer(javascript_code):
+            if match.group() in self.DOM_XSS_SINK_SET:
+                has_sink = True
+            else:
+                has_source = True
+            if has_source and has_sink:
+                return True
 
-        return has_source and has_sink
+        return False
 
     async def _check_external_script_for_dom_xss(self, script_url: str, page_url: str) -> None:
         """Check external JavaScript file for DOM XSS patterns"""
@@ -343,4 +458,4 @@ class XSSTest(BaseSecurityTest):
                     )
 
         except Exception as e:
-            logger.debug(f"Error checking external script {script_url}: {str(e)}")
+            logger.debug("Error checking external script {}: {}", script_url, e)
@@ -1,9 +1,18 @@
 """XXE (XML External Entity) Testing"""
 
+import re
+
 from core.models import TestContext, Severity
 from .base_security_test import BaseSecurityTest
 from loguru import logger
 
+try:
+    # Linear-time DFA matching for attacker-controlled bodies
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
 
 class XXETest(BaseSecurityTest):
     """Test for XXE vulnerabilities"""
@@ -18,20 +27,28 @@ class XXETest(BaseSecurityTest):
         '<?xml version="1.0"?><!DOCTYPE foo [<!ENTITY xxe SYSTEM "http://internal-service">]><foo>&xxe;</foo>',
     ]
 
+    # Input names suggesting the form takes an XML document
+    XML_INPUT_NAMES = frozenset({'xml', 'data'})
+
+    # Entity contents leaking into the response; matched on raw bytes
+    INDICATOR_REGEX = (re2 if RE2_AVAILABLE else re).compile(rb'root:|\[extensions\]|internal-service')
+    INDICATOR_OVERLAP = len(b'internal-service') - 1  # Longest indicator, minus one
+
     async def run_test(self, context: TestContext) -> None:
         """Run XXE tests"""
 
         for page in context.crawled_pages:
             for form in page.forms:
                 # Check if form might accept XML
-                if any(inp.get('type') == 'file' or inp.get('name', '').lower() in ['xml', 'data']
+                if any(inp.get('type') == 'file' or (inp.get('name') or '').lower() in self.XML_INPUT_NAMES
                        for inp in form.get('inputs', [])):
                     await self._test_xxe(form, page.url)
 
         # Test API endpoints that might accept XML
-        for endpoint in context.api_endpoints:
-            if endpoint.response_type and 'xml' in endpoint.response_type.lower():
-                await self._test_api_xxe(endpoint.url, endpoint.method)
+        xml_endpoints = [endpoint for endpoint in context.api_endpoints
+                         if 'xml' in (endpoint.response_type or '').lower()]
+        for endpoint in xml_endpoints:
+            await self._test_api_xxe(endpoint.url, endpoint.method)
 
     async def _test_xxe(self, form: dict, page_url: str) -> None:
         """Test for XXE vulnerability"""
@@ -41,15 +58,16 @@ class XXETest(BaseSecurityTest):
 
         for payload in self.XXE_PAYLOADS:
             try:
-                response = await self.make_request(
+                async with self.stream_request(
                     url,
                     method=method,
                     data=payload,
                     headers={'Content-Type': 'application/xml'}
-                )
+                ) as response:
+                    # Check for XXE indicators, reading no further than the first hit
+                    found = await self.search_stream(response, self.INDICATOR_REGEX, self.INDICATOR_OVERLAP)
 
-                # Check for XXE indicators
-                if 'root:' in response.text or '[extensions]' in response.text or 'internal-service' in response.text:
+                if found is not None:
                     self.add_finding(
                         title="XML External Entity (XXE) Vulnerability",
                         description="Application is vulnerable to XXE attack. External entities in XML are processed, "
@@ -60,9 +78,10 @@ class XXETest(BaseSecurityTest):
                         owasp_category="A05:2021-Security Misconfiguration",
                         payload=payload
                     )
+                    return  # Found vulnerability
 
             except Exception as e:
-                logger.debug(f"Error testing XXE: {str(e)}")
+                logger.debug("Error testing XXE: {}", e)
 
     async def _test_api_xxe(self, url: str, method: str) -> None:
         """Test API endpoint for XXE"""
@@ -1,7 +1,11 @@
 """SEO Testing Module"""
 
+from contextlib import AsyncExitStack
+from typing import Any, Dict, Tuple
+
 import httpx
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 from loguru import logger
 from core.module_loader import BaseTestModule
 from core.models import Category, ModuleResult, TestResult, TestStatus, Finding, Severity, TestContext
@@ -15,6 +19,20 @@ class SEOModule(BaseTestModule):
     category = Category.SEO
     version = "1.0.0"
 
+    # Compiled once; lxml evaluates them in C over its own tree instead of
+    # walking a BeautifulSoup tree in Python for every check
+    TITLE_XPATH = etree.XPath('//title[1]')
+    META_XPATH = etree.XPath('//meta')
+    H1_XPATH = etree.XPath('//h1')
+    IMG_WITHOUT_ALT_XPATH = etree.XPath("//img[not(@alt) or @alt='']")
+    CANONICAL_XPATH = etree.XPath(
+        "//link[contains(concat(' ', normalize-space(@rel), ' '), ' canonical ')][1]"
+    )
+    # boolean() lets libxml2 stop at the first JSON-LD script instead of
+    # collecting all of them
+    HAS_SCHEMA_SCRIPT_XPATH = etree.XPath("boolean(//script[@type='application/ld+json'])")
+    OG_PROPERTY_PREFIX = 'og:'
+
     async def run(self, context: TestContext) -> ModuleResult:
         module_result = ModuleResult(name=self.name, category=self.category, status=TestStatus.RUNNING)
 
@@ -22,93 +40,97 @@ class SEOModule(BaseTestModule):
                                 category=self.category, status=TestStatus.RUNNING)
 
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.get(context.target_url)
-                soup = BeautifulSoup(response.text, 'lxml')
-
-                # Title check
-                title = soup.find('title')
-                if not title or not title.string:
-                    test_result.add_finding(Finding(
-                        title="Missing Title Tag", description="Page is missing a title tag",
-                        severity=Severity.HIGH, category=self.category, url=context.target_url, cwe_id="SEO-001"
-                    ))
-                elif len(title.string) > 60:
-                    test_result.add_finding(Finding(
-                        title="Title Too Long", description=f"Title is {len(title.string)} chars (recommended <60)",
-                        severity=Severity.LOW, category=self.category, url=context.target_url
-                    ))
-
-                # Meta description
-                meta_desc = soup.find('meta', {'name': 'description'})
-                if not meta_desc or not meta_desc.get('content'):
-                    test_result.add_finding(Finding(
-                        title="Missing Meta Description", description="Page lacks meta description",
-                        severity=Severity.MEDIUM, category=self.category, url=context.target_url
-                    ))
-
-                # Meta viewport (mobile-friendly)
-                viewport = soup.find('meta', {'name': 'viewport'})
-                if not viewport:
-                    test_result.add_finding(Finding(
-                        title="Missing Viewport Meta Tag", description="Page not optimized for mobile",
-                        severity=Severity.MEDIUM, category=self.category, url=context.target_url
-                    ))
-
-                # Heading structure
-                h1_tags = soup.find_all('h1')
-                if not h1_tags:
-                    test_result.add_finding(Finding(
-                        title="Missing H1 Tag", description="Page has no H1 heading",
-                        severity=Severity.MEDIUM, category=self.category, url=context.target_url
-                    ))
-                elif len(h1_tags) > 1:
-                    test_result.add_finding(Finding(
-                        title="Multiple H1 Tags", description=f"Page has {len(h1_tags)} H1 tags (recommended: 1)",
-                        severity=Severity.LOW, category=self.category, url=context.target_url
-                    ))
-
-                # Images without alt text
-                images = soup.find_all('img')
-                images_without_alt = [img for img in images if not img.get('alt')]
-                if images_without_alt:
-                    test_result.add_finding(Finding(
-                        title="Images Missing Alt Text",
-                        description=f"{len(images_without_alt)} images missing alt attributes",
-                        severity=Severity.MEDIUM, category=self.category, url=context.target_url
-                    ))
-
-                # Canonical URL
-                canonical = soup.find('link', {'rel': 'canonical'})
-                if not canonical:
-                    test_result.add_finding(Finding(
-                        title="Missing Canonical URL", description="No canonical link tag found",
-                        severity=Severity.LOW, category=self.category, url=context.target_url
-                    ))
-
-                # Open Graph tags
-                og_tags = soup.find_all('meta', property=lambda x: x and x.startswith('og:'))
-                if not og_tags:
-                    test_result.add_finding(Finding(
-                        title="Missing Open Graph Tags", description="No OG tags for social sharing",
-                        severity=Severity.LOW, category=self.category, url=context.target_url
-                    ))
-
-                # Structured data (schema.org)
-                schema_scripts = soup.find_all('script', {'type': 'application/ld+json'})
-                if not schema_scripts:
-                    test_result.add_finding(Finding(
-                        title="No Structured Data", description="No Schema.org structured data found",
-                        severity=Severity.LOW, category=self.category, url=context.target_url
-                    ))
-
-                # Robots meta tag
-                robots_meta = soup.find('meta', {'name': 'robots'})
-                if robots_meta and 'noindex' in robots_meta.get('content', '').lower():
-                    test_result.add_finding(Finding(
-                        title="Page Set to No-Index", description="Page blocked from search engines",
-                        severity=Severity.INFO, category=self.category, url=context.target_url
-                    ))
+            # Reuse the crawler's fetch of the target when there is one,
+            # otherwise fetch it with the scan's shared client
+            response = context.response_cache.get(context.target_url)
+            if response is None:
+                async with AsyncExitStack() as stack:
+                    client = context.http_client or await stack.enter_async_context(httpx.AsyncClient(timeout=30))
+                    response = await client.get(context.target_url)
+            tree = self._parse_html(response)
+            metas, has_og_tags = self._index_meta_tags(tree)
+
+            # Title check
+            title = self.TITLE_XPATH(tree)
+            title = title[0].text if title else None
+            if not title:
+                test_result.add_finding(Finding(
+                    title="Missing Title Tag", description="Page is missing a title tag",
+                    severity=Severity.HIGH, category=self.category, url=context.target_url, cwe_id="SEO-001"
+                ))
+            elif len(title) > 60:
+                test_result.add_finding(Finding(
+                    title="Title Too Long", description=f"Title is {len(title)} chars (recommended <60)",
+                    severity=Severity.LOW, category=self.category, url=context.target_url
+                ))
+
+            # Meta description
+            meta_desc = metas.get('description')
+            if meta_desc is None or not meta_desc.get('content'):
+                test_result.add_finding(Finding(
+                    title="Missing Meta Description", description="Page lacks meta description",
+                    severity=Severity.MEDIUM, category=self.category, url=context.target_url
+                ))
+
+            # Meta viewport (mobile-friendly)
+            viewport = metas.get('viewport')
+            if viewport is None:
+                test_result.add_finding(Finding(
+                    title="Missing Viewport Meta Tag", description="Page not optimized for mobile",
+                    severity=Severity.MEDIUM, category=self.category, url=context.target_url
+                ))
+
+            # Heading structure
+            h1_tags = self.H1_XPATH(tree)
+            if not h1_tags:
+                test_result.add_finding(Finding(
+                    title="Missing H1 Tag", description="Page has no H1 heading",
+                    severity=Severity.MEDIUM, category=self.category, url=context.target_url
+                ))
+            elif len(h1_tags) > 1:
+                test_result.add_finding(Finding(
+                    title="Multiple H1 Tags", description=f"Page has {len(h1_tags)} H1 tags (recommended: 1)",
+                    severity=Severity.LOW, category=self.category, url=context.target_url
+                ))
+
+            # Images without alt text
+            images_without_alt = self.IMG_WITHOUT_ALT_XPATH(tree)
+            if images_without_alt:
+                test_result.add_finding(Finding(
+                    title="Images Missing Alt Text",
+                    description=f"{len(images_without_alt)} images missing alt attributes",
+                    severity=Severity.MEDIUM, category=self.category, url=context.target_url
+                ))
+
+            # Canonical URL
+            canonical = self.CANONICAL_XPATH(tree)
+            if not canonical:
+                test_result.add_finding(Finding(
+                    title="Missing Canonical URL", description="No canonical link tag found",
+                    severity=Severity.LOW, category=self.category, url=context.target_url
+                ))
+
+            # Open Graph tags
+            if not has_og_tags:
+                test_result.add_finding(Finding(
+                    title="Missing Open Graph Tags", description="No OG tags for social sharing",
+                    severity=Severity.LOW, category=self.category, url=context.target_url
+                ))
+
+            # Structured data (schema.org)
+            if not self.HAS_SCHEMA_SCRIPT_XPATH(tree):
+                test_result.add_finding(Finding(
+                    title="No Structured Data", description="No Schema.org structured data found",
+                    severity=Severity.LOW, category=self.category, url=context.target_url
+                ))
+
+            # Robots meta tag
+            robots_meta = metas.get('robots')
+            if robots_meta is not None and 'noindex' in robots_meta.get('content', '').lower():
+                test_result.add_finding(Finding(
+                    title="Page Set to No-Index", description="Page blocked from search engines",
+                    severity=Severity.INFO, category=self.category, url=context.target_url
+                ))
 
         except Exception as e:
             logger.error(f"SEO test error: {str(e)}")
@@ -117,3 +139,40 @@ class SEOModule(BaseTestModule):
         module_result.add_test_result(test_result)
         module_result.mark_completed(TestStatus.PASSED)
         return module_result
+
+    def _index_meta_tags(self, tree) -> Tuple[Dict[str, Any], bool]:
+        """
+        Collect meta tags in one walk
+
+        Args:
+            tree: Parsed document
+
+        Returns:
+            First meta tag per lower-cased name, and whether any Open Graph
+            meta tag is present
+        """
+        metas = {}
+        has_og_tags = False
+        for meta in self.META_XPATH(tree):
+            name = meta.get('name')
+            if name:
+                metas.setdefault(name.lower(), meta)
+            # Only presence matters, so stop checking properties after the first hit
+            if not has_og_tags:
+                has_og_tags = meta.get('property', '').startswith(self.OG_PROPERTY_PREFIX)
+        return metas, has_og_tags
+
+    @staticmethod
+    def _parse_html(response: httpx.Response):
+        """
+        Parse a response body with lxml, decoding it the way httpx does
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Root element of the document
+        """
+        parser = lxml.html.HTMLParser(encoding=response.encoding)
+        # lxml rejects empty documents; treat them as a page with no tags
+        return lxml.html.document_fromstring(response.content.strip() or b'<html></html>', parser=parser)
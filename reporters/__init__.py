@@ -2,10 +2,24 @@
 
 from .html_reporter import HTMLReporter
 from .json_reporter import JSONReporter
-from .pdf_reporter import generate_pdf_report
-from .excel_reporter import generate_excel_report
 from .report_generator import ReportGenerator
 
+
+# The PDF and Excel reporters pull in reportlab and openpyxl (together about
+# 0.3s to import), so they are only loaded when a report is actually requested
+
+def generate_pdf_report(*args, **kwargs) -> str:
+    """Generate PDF report; see reporters.pdf_reporter.generate_pdf_report"""
+    from .pdf_reporter import generate_pdf_report as _generate_pdf_report
+    return _generate_pdf_report(*args, **kwargs)
+
+
+def generate_excel_report(*args, **kwargs) -> str:
+    """Generate Excel report; see reporters.excel_reporter.generate_excel_report"""
+    from .excel_reporter import generate_excel_report as _generate_excel_report
+    return _generate_excel_report(*args, **kwargs)
+
+
 __all__ = [
     'HTMLReporter',
     'JSONReporter',
@@ -10,11 +10,16 @@ from typing import Dict, List, Any, Optional
 
 from openpyxl import Workbook
 from openpyxl.styles import (
-    Font, Alignment, PatternFill, Border, Side
+    Font, Alignment, PatternFill, Border, Side, NamedStyle
 )
 from openpyxl.chart import (
-    PieChart, BarChart, Reference
+    PieChart, BarChart, Reference, Series
 )
+from openpyxl.chart.data_source import (
+    AxDataSource, NumData, NumVal, StrData, StrRef, StrVal
+)
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import Cell
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
 
@@ -47,6 +52,29 @@ class ExcelReporter:
         'subheader': '5D6D7E', # Medium grey
     }
 
+    # Style objects are built once and shared by every cell that uses them
+    FILLS = {name: PatternFill(start_color=color, fill_type='solid') for name, color in COLORS.items()}
+    DEFAULT_FILL = PatternFill(start_color='FFFFFF', fill_type='solid')
+    TITLE_FONT = Font(size=16, bold=True, color='FFFFFF')
+    HEADER_FONT = Font(bold=True, color='FFFFFF')
+    SECTION_FONT = Font(size=14, bold=True)
+    BOLD_FONT = Font(bold=True)
+    CENTER = Alignment(horizontal='center')
+    WRAP_TOP = Alignment(wrap_text=True, vertical='top')
+    THIN_BORDER = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+
+    # Named table-cell style per severity (registered in _add_named_styles)
+    SEVERITY_STYLES = {name: f'table_cell_{name}' for name in ('critical', 'high', 'medium', 'low', 'info')}
+
+    # Vulnerability count above which the workbook is written in
+    # openpyxl's write-only (streaming) mode
+    WRITE_ONLY_THRESHOLD = 500
+
     def __init__(self, output_dir: str = "reports", include_charts: bool = True):
         """
         Initialize Excel reporter
@@ -92,11 +120,15 @@ class ExcelReporter:
                 # Determine test type from vulnerabilities
                 vulns = scan_data.get('vulnerabilities', [])
                 if vulns:
-                    test_types = set()
-                    for v in vulns[:10]:  # Sample first 10
+                    # First three distinct types among the first 10
+                    test_types = []
+                    for v in vulns[:10]:
                         vtype = v.get('type', 'test')
-                        test_types.add(vtype)
-                    test_name = '-'.join(sorted(list(test_types))[:3])
+                        if vtype not in test_types:
+                            test_types.append(vtype)
+                            if len(test_types) == 3:
+                                break
+                    test_name = '-'.join(sorted(test_types))
                 else:
                     test_name = "fullscan"
 
@@ -108,13 +140,17 @@ class ExcelReporter:
 
             filepath = self.output_dir / filename
 
-            # Create workbook
-            wb = Workbook()
+            # Create workbook; large reports stream rows straight to disk
+            # instead of keeping every cell in memory
+            vulnerabilities = scan_data.get('vulnerabilities', [])
+            wb = Workbook(write_only=len(vulnerabilities) > self.WRITE_ONLY_THRESHOLD)
 
             # Remove default sheet
             if 'Sheet' in wb.sheetnames:
                 wb.remove(wb['Sheet'])
 
+            self._add_named_styles(wb)
+
             # Create worksheets
             self._create_summary_sheet(wb, scan_data)
 
@@ -146,17 +182,17 @@ class ExcelReporter:
     def _create_summary_sheet(self, wb: Workbook, scan_data: Dict):
         """Create summary worksheet"""
         ws = wb.create_sheet("Summary", 0)
+        ws.row_dimensions[1].height = 30
 
         # Title
-        ws['A1'] = "Security Scan Report - Summary"
-        ws['A1'].font = Font(size=18, bold=True, color='FFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['header'], fill_type='solid')
-        ws['A1'].alignment = Alignment(horizontal='center', vertical='center')
-        ws.merge_cells('A1:D1')
-        ws.row_dimensions[1].height = 30
+        rows = [[self._cell(
+            ws, "Security Scan Report - Summary",
+            font=Font(size=18, bold=True, color='FFFFFF'),
+            fill=self.FILLS['header'],
+            alignment=Alignment(horizontal='center', vertical='center')
+        )], []]
 
         # Scan information
-        row = 3
         info_data = [
             ['Target', scan_data.get('target', 'Unknown')],
             ['Scan Date', scan_data.get('date', 'N/A')],
@@ -165,49 +201,36 @@ class ExcelReporter:
         ]
 
         for label, value in info_data:
-            ws[f'A{row}'] = label
-            ws[f'A{row}'].font = Font(bold=True)
-            ws[f'B{row}'] = value
-            row += 1
+            rows.append([self._cell(ws, label, font=self.BOLD_FONT), value])
 
         # Summary statistics
-        row += 2
-        ws[f'A{row}'] = "Issues Summary"
-        ws[f'A{row}'].font = Font(size=14, bold=True)
-        row += 1
+        rows += [[], [], [self._cell(ws, "Issues Summary", font=self.SECTION_FONT)]]
 
         # Header row
         headers = ['Severity', 'Count', 'Percentage']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row, col, header)
-            cell.font = Font(bold=True, color='FFFFFF')
-            cell.fill = PatternFill(start_color=self.COLORS['header'], fill_type='solid')
-            cell.alignment = Alignment(horizontal='center')
-
-        row += 1
+        rows.append(self._header_cells(ws, headers))
 
         # Data rows
         summary = scan_data.get('summary', {})
         total_issues = summary.get('total_issues', 0) or 1  # Avoid division by zero
 
         severity_data = [
-            ('Critical', summary.get('critical', 0), self.COLORS['critical']),
-            ('High', summary.get('high', 0), self.COLORS['high']),
-            ('Medium', summary.get('medium', 0), self.COLORS['medium']),
-            ('Low', summary.get('low', 0), self.COLORS['low']),
+            ('Critical', summary.get('critical', 0), self.FILLS['critical']),
+            ('High', summary.get('high', 0), self.FILLS['high']),
+            ('Medium', summary.get('medium', 0), self.FILLS['medium']),
+            ('Low', summary.get('low', 0), self.FILLS['low']),
         ]
 
-        for severity, count, color in severity_data:
-            ws[f'A{row}'] = severity
-            ws[f'A{row}'].fill = PatternFill(start_color=color, fill_type='solid')
-            ws[f'B{row}'] = count
-            ws[f'C{row}'] = f"{(count / total_issues * 100):.1f}%"
-
-            # Center align
-            for col in range(1, 4):
-                ws.cell(row, col).alignment = Alignment(horizontal='center')
+        for severity, count, fill in severity_data:
+            rows.append([
+                self._cell(ws, severity, style='centered', fill=fill),
+                self._cell(ws, count, style='centered'),
+                self._cell(ws, f"{(count / total_issues * 100):.1f}%", style='centered'),
+            ])
 
-            row += 1
+        self._write_rows(ws, rows)
+        ws.merged_cells.add('A1:D1')
+        row = len(rows) + 1
 
         # Add pie chart
         if self.include_charts and total_issues > 0:
@@ -216,65 +239,28 @@ class ExcelReporter:
             chart.height = 10
             chart.width = 15
 
-            # Data reference
+            # Data reference, with the counts already in hand cached on the
+            # series so readers can draw the chart without resolving cells
             data = Reference(ws, min_col=2, min_row=row-4, max_row=row-1)
             labels = Reference(ws, min_col=1, min_row=row-4, max_row=row-1)
 
-            chart.add_data(data)
-            chart.set_categories(labels)
+            series = Series(data)
+            series.val.numRef.numCache = NumData(
+                pt=[NumVal(idx=i, v=count) for i, (_, count, _) in enumerate(severity_data)]
+            )
+            series.cat = AxDataSource(strRef=StrRef(f=str(labels), strCache=StrData(
+                pt=[StrVal(idx=i, v=severity) for i, (severity, _, _) in enumerate(severity_data)]
+            )))
+            chart.series.append(series)
 
             ws.add_chart(chart, f"E{row-6}")
 
-        # Auto-size columns
-        self._autosize_columns(ws)
-
     def _create_vulnerabilities_sheet(self, wb: Workbook, vulnerabilities: List[Dict]):
         """Create vulnerabilities worksheet"""
         ws = wb.create_sheet("Vulnerabilities")
 
-        # Title
-        ws['A1'] = "Vulnerabilities"
-        ws['A1'].font = Font(size=16, bold=True, color='FFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['header'], fill_type='solid')
-        ws.merge_cells('A1:F1')
-
-        # Headers
-        headers = ['ID', 'Severity', 'Type', 'Description', 'Location', 'Remediation']
-        row = 2
-
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row, col, header)
-            cell.font = Font(bold=True, color='FFFFFF')
-            cell.fill = PatternFill(start_color=self.COLORS['header'], fill_type='solid')
-            cell.alignment = Alignment(horizontal='center')
-
-        # Data rows
-        row = 3
-        for i, vuln in enumerate(vulnerabilities, 1):
-            severity = vuln.get('severity', 'Low')
-            color = self.COLORS.get(severity.lower(), 'FFFFFF')
-
-            ws[f'A{row}'] = i
-            ws[f'B{row}'] = severity
-            ws[f'B{row}'].fill = PatternFill(start_color=color, fill_type='solid')
-            ws[f'C{row}'] = vuln.get('type', 'Unknown')
-            ws[f'D{row}'] = vuln.get('description', '')
-            ws[f'E{row}'] = vuln.get('location', '')
-            ws[f'F{row}'] = vuln.get('remediation', '')
-
-            # Wrap text
-            for col in range(1, 7):
-                ws.cell(row, col).alignment = Alignment(wrap_text=True, vertical='top')
-
-            row += 1
-
-        # Apply borders
-        self._apply_table_borders(ws, 2, 1, row-1, 6)
-
-        # Auto-size columns
-        self._autosize_columns(ws)
-
-        # Set column widths manually for better readability
+        # Set column widths manually for better readability; write-only
+        # sheets need them before any row is written
         ws.column_dimensions['A'].width = 8
         ws.column_dimensions['B'].width = 12
         ws.column_dimensions['C'].width = 20
@@ -282,84 +268,96 @@ class ExcelReporter:
         ws.column_dimensions['E'].width = 30
         ws.column_dimensions['F'].width = 40
 
+        # Title
+        ws.append([self._cell(
+            ws, "Vulnerabilities",
+            font=self.TITLE_FONT,
+            fill=self.FILLS['header']
+        )])
+        ws.merged_cells.add('A1:F1')
+
+        # Headers; table borders are set as rows are written
+        headers = ['ID', 'Severity', 'Type', 'Description', 'Location', 'Remediation']
+        header_cells = self._header_cells(ws, headers)
+        for cell in header_cells:
+            cell.border = self.THIN_BORDER
+        ws.append(header_cells)
+
+        # Data rows
+        for i, vuln in enumerate(vulnerabilities, 1):
+            severity = vuln.get('severity', 'Low')
+            ws.append([
+                self._cell(ws, i, style='table_cell'),
+                self._cell(ws, severity, style=self.SEVERITY_STYLES.get(severity.lower(), 'table_cell_default')),
+                self._cell(ws, vuln.get('type', 'Unknown'), style='table_cell'),
+                self._cell(ws, vuln.get('description', ''), style='table_cell'),
+                self._cell(ws, vuln.get('location', ''), style='table_cell'),
+                self._cell(ws, vuln.get('remediation', ''), style='table_cell'),
+            ])
+
     def _create_security_sheet(self, wb: Workbook, security_data: Dict):
         """Create security overview worksheet"""
         ws = wb.create_sheet("Security")
 
         # Title
-        ws['A1'] = "Security Overview"
-        ws['A1'].font = Font(size=16, bold=True, color='FFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['header'], fill_type='solid')
-        ws.merge_cells('A1:D1')
+        rows = [[self._cell(
+            ws, "Security Overview",
+            font=self.TITLE_FONT,
+            fill=self.FILLS['header']
+        )], []]
 
         # Security score
-        row = 3
-        ws[f'A{row}'] = "Overall Security Score"
-        ws[f'A{row}'].font = Font(bold=True)
-        ws[f'B{row}'] = f"{security_data.get('score', 0)}/100"
-        ws[f'B{row}'].font = Font(size=14, bold=True)
+        rows.append([
+            self._cell(ws, "Overall Security Score", font=self.BOLD_FONT),
+            self._cell(ws, f"{security_data.get('score', 0)}/100", font=self.SECTION_FONT),
+        ])
 
         # Tests performed
-        row += 3
-        ws[f'A{row}'] = "Tests Performed"
-        ws[f'A{row}'].font = Font(size=14, bold=True)
-        row += 1
+        rows += [[], [], [self._cell(ws, "Tests Performed", font=self.SECTION_FONT)]]
 
         # Table headers
         headers = ['Test Name', 'Status', 'Issues Found', 'Pass Rate']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row, col, header)
-            cell.font = Font(bold=True, color='FFFFFF')
-            cell.fill = PatternFill(start_color=self.COLORS['header'], fill_type='solid')
-            cell.alignment = Alignment(horizontal='center')
-
-        row += 1
+        rows.append(self._header_cells(ws, headers))
 
         # Test data
         tests = security_data.get('tests_performed', [])
         for test in tests:
-            ws[f'A{row}'] = test.get('name', '')
-            ws[f'B{row}'] = test.get('status', '')
-            ws[f'C{row}'] = test.get('issues', 0)
-            ws[f'D{row}'] = f"{test.get('pass_rate', 0):.1f}%"
+            status_cell = self._cell(ws, test.get('status', ''))
 
             # Color code status
             status = test.get('status', '').lower()
             if status == 'passed':
-                ws[f'B{row}'].fill = PatternFill(start_color=self.COLORS['pass'], fill_type='solid')
+                status_cell.fill = self.FILLS['pass']
             elif status == 'failed':
-                ws[f'B{row}'].fill = PatternFill(start_color=self.COLORS['critical'], fill_type='solid')
+                status_cell.fill = self.FILLS['critical']
 
-            row += 1
+            rows.append([
+                test.get('name', ''),
+                status_cell,
+                test.get('issues', 0),
+                f"{test.get('pass_rate', 0):.1f}%",
+            ])
 
-        # Auto-size columns
-        self._autosize_columns(ws)
+        self._write_rows(ws, rows)
+        ws.merged_cells.add('A1:D1')
 
     def _create_performance_sheet(self, wb: Workbook, performance_data: Dict):
         """Create performance worksheet"""
         ws = wb.create_sheet("Performance")
 
         # Title
-        ws['A1'] = "Performance Analysis"
-        ws['A1'].font = Font(size=16, bold=True, color='FFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['header'], fill_type='solid')
-        ws.merge_cells('A1:D1')
+        rows = [[self._cell(
+            ws, "Performance Analysis",
+            font=self.TITLE_FONT,
+            fill=self.FILLS['header']
+        )], []]
 
         # Metrics
-        row = 3
-        ws[f'A{row}'] = "Performance Metrics"
-        ws[f'A{row}'].font = Font(size=14, bold=True)
-        row += 1
+        rows.append([self._cell(ws, "Performance Metrics", font=self.SECTION_FONT)])
 
         # Table headers
         headers = ['Metric', 'Value', 'Threshold', 'Status']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row, col, header)
-            cell.font = Font(bold=True, color='FFFFFF')
-            cell.fill = PatternFill(start_color=self.COLORS['header'], fill_type='solid')
-            cell.alignment = Alignment(horizontal='center')
-
-        row += 1
+        rows.append(self._header_cells(ws, headers))
 
         # Metrics data
         metrics = performance_data.get('metrics', {})
@@ -371,95 +369,118 @@ class ExcelReporter:
         ]
 
         for metric_name, value, threshold in metrics_list:
-            ws[f'A{row}'] = metric_name
-            ws[f'B{row}'] = value
-            ws[f'C{row}'] = threshold
-            ws[f'D{row}'] = 'Good'  # TODO: Calculate based on threshold
-
-            row += 1
+            rows.append([metric_name, value, threshold, 'Good'])  # TODO: Calculate status based on threshold
 
-        # Auto-size columns
-        self._autosize_columns(ws)
+        self._write_rows(ws, rows)
+        ws.merged_cells.add('A1:D1')
 
     def _create_seo_sheet(self, wb: Workbook, seo_data: Dict):
         """Create SEO worksheet"""
         ws = wb.create_sheet("SEO")
 
         # Title
-        ws['A1'] = "SEO Analysis"
-        ws['A1'].font = Font(size=16, bold=True, color='FFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['header'], fill_type='solid')
-        ws.merge_cells('A1:C1')
+        rows = [[self._cell(
+            ws, "SEO Analysis",
+            font=self.TITLE_FONT,
+            fill=self.FILLS['header']
+        )], []]
 
         # SEO checks
-        row = 3
-        ws[f'A{row}'] = "SEO Checks"
-        ws[f'A{row}'].font = Font(size=14, bold=True)
-        row += 1
+        rows.append([self._cell(ws, "SEO Checks", font=self.SECTION_FONT)])
 
         # Headers
         headers = ['Check', 'Status', 'Issues']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row, col, header)
-            cell.font = Font(bold=True, color='FFFFFF')
-            cell.fill = PatternFill(start_color=self.COLORS['header'], fill_type='solid')
-            cell.alignment = Alignment(horizontal='center')
-
-        row += 1
+        rows.append(self._header_cells(ws, headers))
 
         # SEO checks data
         checks = seo_data.get('checks', [])
         for check in checks:
-            ws[f'A{row}'] = check.get('name', '')
-            ws[f'B{row}'] = check.get('status', '')
-            ws[f'C{row}'] = check.get('issues', 0)
+            status_cell = self._cell(ws, check.get('status', ''))
 
             # Color code status
             if check.get('status') == 'Pass':
-                ws[f'B{row}'].fill = PatternFill(start_color=self.COLORS['pass'], fill_type='solid')
+                status_cell.fill = self.FILLS['pass']
             else:
-                ws[f'B{row}'].fill = PatternFill(start_color=self.COLORS['medium'], fill_type='solid')
+                status_cell.fill = self.FILLS['medium']
 
-            row += 1
+            rows.append([
+                check.get('name', ''),
+                status_cell,
+                check.get('issues', 0),
+            ])
 
-        # Auto-size columns
-        self._autosize_columns(ws)
+        self._write_rows(ws, rows)
+        ws.merged_cells.add('A1:C1')
 
-    def _apply_table_borders(
-        self,
-        ws: Worksheet,
-        start_row: int,
-        start_col: int,
-        end_row: int,
-        end_col: int
-    ):
-        """Apply borders to table"""
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-
-        for row in range(start_row, end_row + 1):
-            for col in range(start_col, end_col + 1):
-                ws.cell(row, col).border = thin_border
-
-    def _autosize_columns(self, ws: Worksheet):
-        """Auto-size columns based on content"""
-        for column in ws.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
+    def _add_named_styles(self, wb: Workbook):
+        """
+        Register the styles repeated across table cells on the workbook
+
+        Assigning a named style is a single lookup, where setting font, fill,
+        alignment and border separately interns each style object per cell.
+        """
+        wb.add_named_style(NamedStyle(
+            name='table_header', font=self.HEADER_FONT, fill=self.FILLS['header'], alignment=self.CENTER
+        ))
+        wb.add_named_style(NamedStyle(name='centered', alignment=self.CENTER))
+
+        # Vulnerability table cells: bordered, wrapped text, severity fill
+        wb.add_named_style(NamedStyle(name='table_cell', border=self.THIN_BORDER, alignment=self.WRAP_TOP))
+        for name, style_name in [*self.SEVERITY_STYLES.items(), ('default', 'table_cell_default')]:
+            wb.add_named_style(NamedStyle(
+                name=style_name, border=self.THIN_BORDER, alignment=self.WRAP_TOP,
+                fill=self.FILLS.get(name, self.DEFAULT_FILL)
+            ))
+
+    def _header_cells(self, ws: Worksheet, headers: List[str]) -> List[Cell]:
+        """Create styled table header cells"""
+        return [self._cell(ws, header, style='table_header') for header in headers]
+
+    def _cell(self, ws: Worksheet, value: Any, **styles) -> Cell:
+        """
+        Create a styled cell for ws.append
 
+        Cells are detached until appended, so the same code builds normal and
+        write-only sheets. Unstyled values are appended as-is instead.
+
+        Args:
+            ws: Worksheet the cell will be appended to
+            value: Cell value
+            **styles: Cell style attributes (font, fill, alignment, border)
+                or a registered named style (style)
+
+        Returns:
+            Styled cell
+        """
+        cell = WriteOnlyCell(ws, value)
+        for name, style in styles.items():
+            setattr(cell, name, style)
+        return cell
+
+    def _write_rows(self, ws: Worksheet, rows: List[List[Any]]):
+        """
+        Auto-size columns to the rows' content, then append them
+
+        Widths come from the values being written rather than a read-back of
+        the sheet, and are set first because write-only sheets emit column
+        widths ahead of the rows.
+
+        Args:
+            ws: Worksheet
+            rows: Rows of styled cells or plain values; empty lists are blank rows
+        """
+        widths: Dict[int, int] = {}
+        for row in rows:
+            for col, cell in enumerate(row, 1):
+                value = cell.value if isinstance(cell, Cell) else cell
+                widths[col] = max(widths.get(col, 0), len(str(value)))
+
+        for col, max_length in widths.items():
             adjusted_width = min(max_length + 2, 50)  # Cap at 50
-            ws.column_dimensions[column_letter].width = adjusted_width
+            ws.column_dimensions[get_column_letter(col)].width = adjusted_width
+
+        for row in rows:
+            ws.append(row)
 
 
 # Convenience function
@@ -1,9 +1,18 @@
 """JSON Report Generator"""
 
 import json
+from typing import Any, BinaryIO, Callable, List, Tuple
+from pydantic import BaseModel
 from core.models import ScanResult
 from core.config import ConfigManager
 
+try:
+    # Rust encoder; serialises datetimes, enums and numpy values natively
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class JSONReporter:
     """Generate JSON format reports"""
@@ -12,15 +21,76 @@ class JSONReporter:
         self.config = config
 
     def generate(self, scan_result: ScanResult, output_path: str) -> None:
-        """Generate JSON report"""
-
-        # Convert to dict and save
-        report_data = scan_result.model_dump()
+        """
+        Generate JSON report
 
+        Module results are dumped and encoded one at a time, so the whole
+        report never exists as a single dict or encoded buffer. The output is
+        the same as encoding scan_result.model_dump() in one go.
+        """
         pretty_print = self.config.config.reporting.formats.get('json', {}).get('pretty_print', True)
+        dumps = self._encoder(pretty_print)
+        item_separator, key_separator = self._separators(pretty_print)
+        newline = b'\n' if pretty_print else b''
+
+        # Everything except the module results is small
+        fields = scan_result.model_dump(exclude={'module_results'})
 
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with open(output_path, 'wb') as f:
+            f.write(b'{')
+            for i, name in enumerate(type(scan_result).model_fields):
+                f.write((item_separator if i else b'') + self._indent(newline + dumps(name), 1, pretty_print) + key_separator)
+                if name == 'module_results':
+                    self._write_array(f, scan_result.module_results, dumps, item_separator, pretty_print)
+                else:
+                    f.write(self._indent(dumps(fields[name]), 1, pretty_print))
+            f.write(newline + b'}')
+
+    @staticmethod
+    def _encoder(pretty_print: bool) -> Callable[[Any], bytes]:
+        """Get a function encoding a value to JSON bytes"""
+        if ORJSON_AVAILABLE:
+            # Metadata dicts may carry non-string keys, which json.dump coerces
+            options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
             if pretty_print:
-                json.dump(report_data, f, indent=2, default=str)
-            else:
-                json.dump(report_data, f, default=str)
+                options |= orjson.OPT_INDENT_2
+            return lambda value: orjson.dumps(value, default=str, option=options)
+
+        indent = 2 if pretty_print else None
+        return lambda value: json.dumps(value, indent=indent, default=str).encode('utf-8')
+
+    @staticmethod
+    def _separators(pretty_print: bool) -> Tuple[bytes, bytes]:
+        """Get the item and key separators the encoder puts between values"""
+        if pretty_print:
+            return b',', b': '
+        if ORJSON_AVAILABLE:
+            return b',', b':'
+        # json.dumps defaults without indent
+        return b', ', b': '
+
+    @staticmethod
+    def _indent(encoded: bytes, depth: int, pretty_print: bool) -> bytes:
+        """Re-indent an encoded value nested depth levels deep"""
+        if not pretty_print:
+            return encoded
+        return encoded.replace(b'\n', b'\n' + b'  ' * depth)
+
+    def _write_array(
+        self,
+        f: BinaryIO,
+        items: List[BaseModel],
+        dumps: Callable[[Any], bytes],
+        item_separator: bytes,
+        pretty_print: bool
+    ) -> None:
+        """Write a list of models as a JSON array, dumping one item at a time"""
+        if not items:
+            f.write(b'[]')
+            return
+
+        newline = b'\n' if pretty_print else b''
+        f.write(b'[')
+        for i, item in enumerate(items):
+            f.write((item_separator if i else b'') + self._indent(newline + dumps(item.model_dump()), 2, pretty_print))
+        f.write(self._indent(newline + b']', 1, pretty_print))
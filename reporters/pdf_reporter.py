@@ -4,26 +4,26 @@ Professional PDF reports with charts, tables, and visualizations
 """
 
 import os
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+from xml.sax.saxutils import escape
 import io
 
 from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import inch
 from reportlab.platypus import (
     SimpleDocTemplate, Table, TableStyle, Paragraph,
-    Spacer, PageBreak, Image, KeepTogether
+    Spacer, PageBreak, Preformatted, XPreformatted
 )
 from reportlab.platypus.flowables import HRFlowable
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
-from reportlab.pdfgen import canvas
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
 from reportlab.graphics.shapes import Drawing
 from reportlab.graphics.charts.piecharts import Pie
-from reportlab.graphics.charts.barcharts import VerticalBarChart
-from reportlab.graphics.charts.linecharts import HorizontalLineChart
 
 from loguru import logger
 
@@ -55,6 +55,29 @@ class PDFReporter:
         'secondary': colors.HexColor('#5D6D7E'), # Medium grey
     }
 
+    # Vulnerability severities, in report order
+    SEVERITIES = ['Critical', 'High', 'Medium', 'Low', 'Info']
+
+    # Sections included when their key is in the scan data, in report order
+    OPTIONAL_SECTIONS = [
+        ('security', '_create_security_section'),
+        ('vulnerabilities', '_create_vulnerabilities_section'),
+        ('performance', '_create_performance_section'),
+        ('recommendations', '_create_recommendations_section'),
+    ]
+
+    # Column widths, in characters, of the fixed-width listings
+    SECURITY_COLUMNS = [60, 25, 15]
+    VULNERABILITY_COLUMNS = [5, 18, 54, 31]
+
+    # Rows listed per severity; the rest are left to the JSON report so large
+    # scans do not produce hundreds of pages of listings
+    MAX_ROWS_PER_SEVERITY = 200
+
+    # Paragraph and table styles, shared by all instances
+    _styles: Optional[StyleSheet1] = None
+    _table_styles: Dict[str, TableStyle] = {}
+
     def __init__(
         self,
         output_dir: str = "reports",
@@ -75,62 +98,122 @@ class PDFReporter:
         self.include_charts = include_charts
 
         # Styles
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        self.styles = self._setup_custom_styles()
+        self.table_styles = self._table_styles
+
+    @classmethod
+    def _setup_custom_styles(cls) -> StyleSheet1:
+        """
+        Setup custom paragraph and table styles
+
+        The styles never change, so they are built once and shared by every
+        reporter instance.
+
+        Returns:
+            Stylesheet with the custom paragraph styles added
+        """
+        if cls._styles is not None:
+            return cls._styles
+
+        styles = getSampleStyleSheet()
 
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles"""
         # Title
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CustomTitle',
-            parent=self.styles['Heading1'],
+            parent=styles['Heading1'],
             fontSize=24,
-            textColor=self.COLORS['primary'],
+            textColor=cls.COLORS['primary'],
             spaceAfter=30,
             alignment=TA_CENTER,
             fontName='Helvetica-Bold'
         ))
 
         # Subtitle
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CustomSubtitle',
-            parent=self.styles['Heading2'],
+            parent=styles['Heading2'],
             fontSize=16,
-            textColor=self.COLORS['secondary'],
+            textColor=cls.COLORS['secondary'],
             spaceAfter=20,
             alignment=TA_CENTER
         ))
 
         # Section Header
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='SectionHeader',
-            parent=self.styles['Heading2'],
+            parent=styles['Heading2'],
             fontSize=14,
-            textColor=self.COLORS['primary'],
+            textColor=cls.COLORS['primary'],
             spaceAfter=12,
             spaceBefore=12,
             fontName='Helvetica-Bold'
         ))
 
         # Subsection Header
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='SubsectionHeader',
-            parent=self.styles['Heading3'],
+            parent=styles['Heading3'],
             fontSize=12,
-            textColor=self.COLORS['secondary'],
+            textColor=cls.COLORS['secondary'],
             spaceAfter=10,
             fontName='Helvetica-Bold'
         ))
 
         # Body
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CustomBody',
-            parent=self.styles['BodyText'],
+            parent=styles['BodyText'],
             fontSize=10,
             alignment=TA_JUSTIFY,
             spaceAfter=10
         ))
 
+        # Fixed-width column listings (see _create_column_rows)
+        styles.add(ParagraphStyle(
+            name='ColumnRow',
+            fontName='Courier',
+            fontSize=7.5,
+            leading=10
+        ))
+        styles.add(ParagraphStyle(
+            name='ColumnHeader',
+            parent=styles['ColumnRow'],
+            fontName='Courier-Bold',
+            textColor=colors.whitesmoke,
+            backColor=cls.COLORS['primary'],
+            borderPadding=(2, 0, 3, 0),
+            spaceBefore=3,
+            spaceAfter=4
+        ))
+        # Vulnerability listings take their header colour from the severity
+        for severity in cls.SEVERITIES:
+            styles.add(ParagraphStyle(
+                name=f'ColumnHeader{severity}',
+                parent=styles['ColumnHeader'],
+                backColor=cls.COLORS.get(severity.lower(), colors.gray)
+            ))
+
+        # Tables share a header row and grid, and differ in alignment and sizing
+        header = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), cls.COLORS['primary']),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ])
+        cls._table_styles = {
+            'cover': TableStyle([
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTSIZE', (0, 0), (-1, 0), 12),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ], parent=header),
+            'performance': TableStyle([
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ], parent=header),
+        }
+
+        cls._styles = styles
+        return styles
+
     def generate(
         self,
         scan_data: Dict[str, Any],
@@ -149,28 +232,11 @@ class PDFReporter:
         try:
             # Generate filename
             if not filename:
-                from urllib.parse import urlparse
-
-                # Extract site name from URL
-                target_url = scan_data.get('target', 'unknown-site')
-                try:
-                    parsed_url = urlparse(target_url)
-                    site_name = parsed_url.netloc.replace(':', '-').replace('.', '-')
-                    if not site_name:
-                        site_name = "unknown-site"
-                except:
-                    site_name = "unknown-site"
-
-                # Determine test type from vulnerabilities
+                site_name = _site_name_from_url(scan_data.get('target', 'unknown-site'))
+
+                # Determine test type from a sample of the first 10 vulnerabilities
                 vulns = scan_data.get('vulnerabilities', [])
-                if vulns:
-                    test_types = set()
-                    for v in vulns[:10]:  # Sample first 10
-                        vtype = v.get('type', 'test')
-                        test_types.add(vtype)
-                    test_name = '-'.join(sorted(list(test_types))[:3])
-                else:
-                    test_name = "fullscan"
+                test_name = _test_name_from_types(frozenset(v.get('type', 'test') for v in vulns[:10]))
 
                 # Create timestamp
                 timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
@@ -180,47 +246,15 @@ class PDFReporter:
 
             filepath = self.output_dir / filename
 
-            # Create PDF document
-            doc = SimpleDocTemplate(
-                str(filepath),
-                pagesize=self.page_size,
-                rightMargin=0.75*inch,
-                leftMargin=0.75*inch,
-                topMargin=1*inch,
-                bottomMargin=1*inch
-            )
-
             # Build content
             story = []
-
-            # Cover page
-            story.extend(self._create_cover_page(scan_data))
-            story.append(PageBreak())
-
-            # Executive summary
-            story.extend(self._create_executive_summary(scan_data))
-            story.append(PageBreak())
-
-            # Security overview
-            if 'security' in scan_data:
-                story.extend(self._create_security_section(scan_data['security']))
-                story.append(PageBreak())
-
-            # Vulnerabilities
-            if 'vulnerabilities' in scan_data:
-                story.extend(self._create_vulnerabilities_section(scan_data['vulnerabilities']))
-                story.append(PageBreak())
-
-            # Performance
-            if 'performance' in scan_data:
-                story.extend(self._create_performance_section(scan_data['performance']))
-                story.append(PageBreak())
-
-            # Recommendations
-            if 'recommendations' in scan_data:
-                story.extend(self._create_recommendations_section(scan_data['recommendations']))
+            for method, data in self._sections(scan_data):
+                if story:
+                    story.append(PageBreak())
+                story.extend(getattr(self, method)(data))
 
             # Build PDF
+            doc = self._create_document(str(filepath))
             doc.build(story, onFirstPage=self._add_page_number, onLaterPages=self._add_page_number)
 
             logger.info(f"PDF report generated: {filepath}")
@@ -233,6 +267,33 @@ class PDFReporter:
                 original_error=e
             )
 
+    def _create_document(self, target) -> SimpleDocTemplate:
+        """Create a document template with the report page size and margins"""
+        return SimpleDocTemplate(
+            target,
+            pagesize=self.page_size,
+            rightMargin=0.75*inch,
+            leftMargin=0.75*inch,
+            topMargin=1*inch,
+            bottomMargin=1*inch
+        )
+
+    def _sections(self, scan_data: Dict) -> List[Tuple[str, Any]]:
+        """
+        List the report sections present in the scan data
+
+        Returns:
+            (builder method name, section data) pairs, in report order
+        """
+        sections = [
+            ('_create_cover_page', scan_data),
+            ('_create_executive_summary', scan_data),
+        ]
+        for key, method in self.OPTIONAL_SECTIONS:
+            if key in scan_data:
+                sections.append((method, scan_data[key]))
+        return sections
+
     def _create_cover_page(self, scan_data: Dict) -> List:
         """Create cover page"""
         elements = []
@@ -264,15 +325,7 @@ class PDFReporter:
             ]
 
             table = Table(summary_data, colWidths=[3*inch, 2*inch])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), self.COLORS['primary']),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ]))
+            table.setStyle(self.table_styles['cover'])
 
             elements.append(table)
 
@@ -313,8 +366,12 @@ class PDFReporter:
             f"Detected {summary.get('medium', 0)} medium-severity concerns",
         ])
 
-        for finding in findings:
-            elements.append(Paragraph(f"• {finding}", self.styles['CustomBody']))
+        # One paragraph for all bullets; findings may quote page content, which
+        # would otherwise be parsed as reportlab markup
+        elements.append(Paragraph(
+            '<br/>'.join(f"• {escape(str(finding))}" for finding in findings),
+            self.styles['CustomBody']
+        ))
 
         return elements
 
@@ -337,26 +394,13 @@ class PDFReporter:
         if tests:
             elements.append(Paragraph("Tests Performed:", self.styles['SubsectionHeader']))
 
-            test_data = [['Test Name', 'Status', 'Issues Found']]
-            for test in tests:
-                test_data.append([
-                    test.get('name', ''),
-                    test.get('status', ''),
-                    str(test.get('issues', 0))
-                ])
-
-            table = Table(test_data, colWidths=[3*inch, 1.5*inch, 1.5*inch])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), self.COLORS['primary']),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
-            ]))
-
-            elements.append(table)
+            test_rows = [
+                [test.get('name', ''), test.get('status', ''), test.get('issues', 0)]
+                for test in tests
+            ]
+            elements.extend(self._create_column_rows(
+                ['Test Name', 'Status', 'Issues Found'], test_rows, self.SECURITY_COLUMNS, 'ColumnHeader'
+            ))
 
         return elements
 
@@ -368,57 +412,83 @@ class PDFReporter:
         elements.append(HRFlowable(width="100%", thickness=2, color=self.COLORS['primary']))
         elements.append(Spacer(1, 0.2*inch))
 
-        # Group by severity
-        by_severity = {
-            'Critical': [],
-            'High': [],
-            'Medium': [],
-            'Low': []
-        }
-
+        # Group by severity in a single pass. Scan results carry lowercase
+        # severity values, so normalise them to the SEVERITIES spelling
+        by_severity = defaultdict(list)
         for vuln in vulnerabilities:
-            severity = vuln.get('severity', 'Low')
+            severity = str(vuln.get('severity') or 'Low').capitalize()
+            if severity not in self.SEVERITIES:
+                logger.warning(f"Unknown vulnerability severity '{severity}', listing it as Low")
+                severity = 'Low'
             by_severity[severity].append(vuln)
 
         # Display each severity group
-        for severity in ['Critical', 'High', 'Medium', 'Low']:
-            vulns = by_severity[severity]
+        for severity in self.SEVERITIES:
+            vulns = by_severity.get(severity)
             if not vulns:
                 continue
 
             # Severity header
-            color = self.COLORS.get(severity.lower(), colors.gray)
             elements.append(Paragraph(
                 f"{severity} Severity ({len(vulns)} issues)",
                 self.styles['SubsectionHeader']
             ))
 
-            # Vulnerability table
-            vuln_data = [['ID', 'Type', 'Description', 'Location']]
-
-            for i, vuln in enumerate(vulns, 1):
-                vuln_data.append([
-                    str(i),
-                    vuln.get('type', 'Unknown'),
-                    vuln.get('description', '')[:50] + '...',
-                    vuln.get('location', '')[:30]
-                ])
-
-            table = Table(vuln_data, colWidths=[0.5*inch, 1.5*inch, 2.5*inch, 2*inch])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), color),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ]))
-
-            elements.append(table)
+            # Vulnerability listing
+            vuln_rows = []
+            for i, vuln in enumerate(vulns[:self.MAX_ROWS_PER_SEVERITY], 1):
+                # Only descriptions that are actually cut get an ellipsis
+                description = vuln.get('description') or ''
+                if len(description) > 50:
+                    description = description[:50] + '...'
+                vuln_rows.append([i, vuln.get('type', 'Unknown'), description, (vuln.get('location') or '')[:30]])
+
+            elements.extend(self._create_column_rows(
+                ['ID', 'Type', 'Description', 'Location'], vuln_rows, self.VULNERABILITY_COLUMNS,
+                f'ColumnHeader{severity}'
+            ))
+            remaining = len(vulns) - self.MAX_ROWS_PER_SEVERITY
+            if remaining > 0:
+                elements.append(Spacer(1, 0.1*inch))
+                elements.append(Paragraph(
+                    f"... and {remaining} more {severity.lower()} issues; see the JSON report for the full list",
+                    self.styles['CustomBody']
+                ))
             elements.append(Spacer(1, 0.3*inch))
 
         return elements
 
+    def _create_column_rows(
+        self,
+        header: List[str],
+        rows: List[List[Any]],
+        widths: List[int],
+        header_style: str
+    ) -> List:
+        """
+        Lay out rows as fixed-width monospace columns
+
+        Used instead of Table for listings that can run over many pages:
+        splitting a long Table is slow, while a preformatted block splits by
+        line. Values wider than their column are cut.
+
+        Args:
+            header: Column titles
+            rows: Row values
+            widths: Column widths in characters
+            header_style: Paragraph style of the header bar
+
+        Returns:
+            Header and row flowables
+        """
+        def format_row(values):
+            return ''.join(str(value)[:width - 1].ljust(width) for value, width in zip(values, widths))
+
+        return [
+            XPreformatted(format_row(header), self.styles[header_style]),
+            Preformatted('\n'.join(map(format_row, rows)), self.styles['ColumnRow'])
+        ]
+
     def _create_performance_section(self, performance_data: Dict) -> List:
         """Create performance section"""
         elements = []
@@ -436,13 +506,7 @@ class PDFReporter:
         metrics_data.append(['Total Requests', str(metrics.get('total_requests', 0)), 'N/A'])
 
         table = Table(metrics_data, colWidths=[2.5*inch, 2*inch, 1.5*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), self.COLORS['primary']),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ]))
+        table.setStyle(self.table_styles['performance'])
 
         elements.append(table)
 
@@ -520,6 +584,44 @@ class PDFReporter:
         canvas.restoreState()
 
 
+@lru_cache(maxsize=256)
+def _site_name_from_url(target_url: str) -> str:
+    """
+    Get the filename-safe site name of a target URL
+
+    Cached, as repeated scans of a target produce many reports.
+
+    Args:
+        target_url: Scan target URL
+
+    Returns:
+        Host and port with separators replaced by dashes
+    """
+    from urllib.parse import urlparse
+
+    try:
+        site_name = urlparse(target_url).netloc.replace(':', '-').replace('.', '-')
+    except (TypeError, ValueError):
+        site_name = ""
+    return site_name or "unknown-site"
+
+
+@lru_cache(maxsize=256)
+def _test_name_from_types(test_types: frozenset) -> str:
+    """
+    Get the filename test name from the vulnerability types found
+
+    Args:
+        test_types: Distinct vulnerability types
+
+    Returns:
+        Up to three types joined by dashes, or "fullscan" if there are none
+    """
+    if not test_types:
+        return "fullscan"
+    return '-'.join(sorted(test_types)[:3])
+
+
 # Convenience function
 
 def generate_pdf_report(
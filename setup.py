@@ -39,6 +39,6 @@ setup(
     },
     include_package_data=True,
     package_data={
-        "": ["*.yaml", "*.txt", "*.md"],
+        "": ["*.yaml", "*.txt", "*.md", "*.j2"],
     },
 )
@@ -0,0 +1,628 @@
+"""
+Unit tests for security test helpers
+"""
+
+import re
+import pytest
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+from core.config import ConfigManager
+from core.http_client import create_http_client
+from core.models import ApiEndpoint, CrawledPage, TestContext
+from modules.security.tests.base_security_test import BaseSecurityTest
+from modules.security.tests.command_injection import CommandInjectionTest
+from modules.security.tests.cookies_security import CookiesSecurityTest
+from modules.security.tests.info_disclosure import InfoDisclosureTest
+from modules.security.tests.open_redirect import OpenRedirectTest
+from modules.security.tests.param_keywords import classify_param_name
+from modules.security.tests.sql_injection import SQLInjectionTest, TestTarget as SQLiTarget
+from modules.security.tests.ssl_tls import SSLTLSTest
+from modules.security.tests.xss import XSSTest, _reflection_pattern
+from modules.security.tests.xxe import XXETest
+
+
+def _mock_client(handler):
+    """Client answering every request with handler, for streamed requests"""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class DummySecurityTest(BaseSecurityTest):
+    """Minimal concrete security test"""
+
+    name = "dummy"
+    config_key = "dummy"
+
+    async def run_test(self, context) -> None:
+        pass
+
+
+@pytest.fixture
+def config():
+    """Config with default target headers and cookies"""
+    config = ConfigManager()
+    config.config.target.headers = {'User-Agent': 'WebTestool'}
+    config.config.target.cookies = {'session': 'abc'}
+    return config
+
+
+def _patched_client():
+    """Patch httpx.AsyncClient and return (patcher, request mock)"""
+    client = MagicMock()
+    client.request = AsyncMock(return_value=MagicMock(status_code=200))
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=False)
+    patcher = patch('modules.security.tests.base_security_test.httpx.AsyncClient', return_value=client)
+    return patcher, client.request
+
+
+class TestMakeRequest:
+    """Test BaseSecurityTest.make_request"""
+
+    @pytest.mark.asyncio
+    async def test_uses_cached_defaults(self, config):
+        """Test default headers and cookies are reused without copying"""
+        test = DummySecurityTest(config, {})
+        patcher, request = _patched_client()
+
+        with patcher:
+            await test.make_request('https://example.com')
+            await test.make_request('https://example.com')
+
+        first, second = request.call_args_list
+        assert first.kwargs['headers'] is test._default_headers
+        assert second.kwargs['headers'] is test._default_headers
+        assert first.kwargs['cookies'] is test._default_cookies
+
+    @pytest.mark.asyncio
+    async def test_merges_overrides(self, config):
+        """Test caller headers are merged over defaults"""
+        test = DummySecurityTest(config, {})
+        patcher, request = _patched_client()
+
+        with patcher:
+            await test.make_request('https://example.com', headers={'Origin': 'null'})
+
+        headers = request.call_args.kwargs['headers']
+        assert headers == {'User-Agent': 'WebTestool', 'Origin': 'null'}
+        assert test._default_headers == {'User-Agent': 'WebTestool'}
+
+    @pytest.mark.asyncio
+    async def test_stream_search_spans_chunks(self, config):
+        """Test a match split across streamed chunks is found"""
+        test = DummySecurityTest(config, {}, client=_mock_client(
+            lambda request: httpx.Response(200, content=b'x' * 10 + b'needle' + b'y' * 10)))
+        test.STREAM_CHUNK_BYTES = 13
+
+        async with test.stream_request('https://example.com') as response:
+            excerpt = await test.search_stream(response, re.compile(b'needle'), 5)
+
+        assert b'needle' in excerpt
+
+
+    @pytest.mark.asyncio
+    async def test_head_falls_back_to_ranged_get(self, config):
+        """Test HEAD rejected with 405 is retried as a one-byte GET"""
+        test = DummySecurityTest(config, {})
+        patcher, request = _patched_client()
+        request.side_effect = [MagicMock(status_code=405), MagicMock(status_code=206)]
+
+        with patcher:
+            response = await test.make_request('https://example.com', method='HEAD')
+
+        assert response.status_code == 206
+        retry = request.call_args_list[1].kwargs
+        assert retry['method'] == 'GET'
+        assert retry['headers']['Range'] == 'bytes=0-0'
+
+
+    @pytest.mark.asyncio
+    async def test_baseline_response_fetched_once(self, config):
+        """Test the baseline response is shared through the context"""
+        context = TestContext(target_url='https://example.com', base_url='https://example.com')
+        first = DummySecurityTest(config, {})
+        second = DummySecurityTest(config, {})
+        first.make_request = AsyncMock(return_value=MagicMock(status_code=200))
+        second.make_request = AsyncMock()
+
+        response = await first.get_baseline_response(context)
+
+        assert await second.get_baseline_response(context) is response
+        first.make_request.assert_awaited_once_with('https://example.com')
+        second.make_request.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_crawled_response_reused(self, config):
+        """Test responses seeded by the crawler are served without a request"""
+        crawled = httpx.Response(200, text='<html></html>')
+        context = TestContext(target_url='https://example.com', base_url='https://example.com',
+                              response_cache={'https://example.com/about': crawled})
+        test = DummySecurityTest(config, {})
+        test.make_request = AsyncMock()
+
+        assert await test.get_cached_response('https://example.com/about', context) is crawled
+        test.make_request.assert_not_awaited()
+
+
+    def test_scan_text_is_bounded(self, config):
+        """Test only the first MAX_SCAN_BYTES are decoded"""
+        test = DummySecurityTest(config, {})
+        test.MAX_SCAN_BYTES = 8
+        response = httpx.Response(200, content='héllo wörld'.encode('utf-8'))
+
+        assert test.get_scan_text(response) == 'héllo w'
+
+
+    @pytest.mark.asyncio
+    async def test_shared_client_is_used(self, config):
+        """Test requests go through the injected client"""
+        client = MagicMock()
+        client.request = AsyncMock(return_value=MagicMock(status_code=200))
+        test = DummySecurityTest(config, {}, client=client)
+
+        with patch('modules.security.tests.base_security_test.httpx.AsyncClient') as client_class:
+            await test.make_request('https://example.com', allow_redirects=False)
+
+        client_class.assert_not_called()
+        assert client.request.call_args.kwargs['follow_redirects'] is False
+
+    @pytest.mark.asyncio
+    async def test_shared_client_does_not_persist_cookies(self):
+        """Test response cookies never leak into later requests"""
+        async with create_http_client() as client:
+            response = httpx.Response(
+                200,
+                headers={'Set-Cookie': 'session=abc; Path=/'},
+                request=httpx.Request('GET', 'https://example.com/')
+            )
+            client.cookies.extract_cookies(response)
+
+            assert len(client.cookies) == 0
+
+
+class TestParamKeywords:
+    """Test shared input-name classification"""
+
+    def test_overlapping_categories(self):
+        """Test a name can belong to several categories"""
+        assert classify_param_name('FilePath') == frozenset({'cmd', 'path'})
+        assert classify_param_name('return_url') == frozenset({'redirect', 'ssrf'})
+        assert classify_param_name('WebhookURI') == frozenset({'ssrf'})
+        assert classify_param_name('csrf_token') == frozenset({'csrf'})
+        assert classify_param_name('username') == frozenset()
+
+
+class TestOpenRedirect:
+    """Test OpenRedirectTest URL construction"""
+
+    @pytest.mark.asyncio
+    async def test_preserves_query_order(self, config):
+        """Test only the targeted parameter is rewritten"""
+        test = OpenRedirectTest(config, {})
+        test.make_request = AsyncMock(return_value=MagicMock(status_code=200))
+
+        await test._test_open_redirect('https://example.com/login?a=1&next=%2Fhome&b=2', 'next')
+
+        urls = [call.args[0] for call in test.make_request.call_args_list]
+        assert urls == [
+            'https://example.com/login?a=1&next=http%3A%2F%2Fevil.com&b=2',
+            'https://example.com/login?a=1&next=%2F%2Fevil.com&b=2',
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('raw_name,param', [('return%5Furl', 'return_url'), ('next+url', 'next url')])
+    async def test_encoded_param_name_is_rewritten(self, config, raw_name, param):
+        """Test parameters whose names are encoded in the URL still get the payload"""
+        test = OpenRedirectTest(config, {})
+        test.make_request = AsyncMock(return_value=MagicMock(status_code=200))
+
+        await test._test_open_redirect(f'https://example.com/login?{raw_name}=%2Fhome&b=2', param)
+
+        sent = [parse_qs(urlparse(call.args[0]).query) for call in test.make_request.call_args_list]
+        assert sent == [
+            {param: ['http://evil.com'], 'b': ['2']},
+            {param: ['//evil.com'], 'b': ['2']},
+        ]
+
+
+class TestInfoDisclosure:
+    """Test InfoDisclosureTest comment scanning"""
+
+    def test_sensitive_comment_detected(self, config):
+        """Test keywords inside comments are found case-insensitively"""
+        test = InfoDisclosureTest(config, {})
+        body = b'<html><!-- layout --><p>x</p><!-- TODO: remove API key --></html>'
+        assert test._has_sensitive_comment(body)
+
+    def test_keywords_outside_comments_ignored(self, config):
+        """Test keywords in markup or unterminated comments are ignored"""
+        test = InfoDisclosureTest(config, {})
+        assert not test._has_sensitive_comment(b'<input name="password"><!-- ok -->')
+        assert not test._has_sensitive_comment(b'<!-- secret')
+
+    def test_error_page_technology_matched_case_insensitively(self):
+        """Test the error page pattern matches mixed-case text without lowercasing it"""
+        assert InfoDisclosureTest.ERROR_TECH_RE.search('<address>Apache/2.4.41 (Ubuntu)</address>')
+        assert not InfoDisclosureTest.ERROR_TECH_RE.search('<h1>Not Found</h1>')
+
+
+class TestCookiesSecurity:
+    """Test CookiesSecurityTest Set-Cookie parsing"""
+
+    @pytest.mark.asyncio
+    async def test_reports_missing_attributes(self, config):
+        """Test only cookies missing attributes are reported"""
+        test = CookiesSecurityTest(config, {})
+        response = httpx.Response(200, headers=[
+            ('Set-Cookie', 'session=abc; Path=/; Secure; HttpOnly; SameSite=Lax'),
+            ('Set-Cookie', 'tracking=1; path=/; secure'),
+        ])
+        test.make_request = AsyncMock(return_value=response)
+
+        await test.run_test(TestContext(target_url='https://example.com', base_url='https://example.com'))
+
+        findings = test.test_result.findings
+        assert len(findings) == 1
+        assert findings[0].metadata['cookie_name'] == 'tracking'
+        assert 'Secure' not in findings[0].description
+
+
+class TestSQLInjection:
+    """Test SQLInjectionTest response checks"""
+
+    @pytest.mark.parametrize("text", [
+        "You have an error in your SQL syntax; check the manual for your MySQL server",
+        "Warning: pg_query(): Query failed",
+        "ORA-01756: quoted string not properly terminated",
+        "System.Data.SQLite.SQLiteException: near",
+        "microsoft sql native client error '80040e14'",
+    ])
+    def test_sql_errors_detected(self, config, text):
+        """Test known database error messages are detected"""
+        assert SQLInjectionTest(config, {})._check_sql_errors(text)
+
+    def test_clean_response_not_flagged(self, config):
+        """Test ordinary pages are not flagged"""
+        assert not SQLInjectionTest(config, {})._check_sql_errors("<html><body>Welcome back</body></html>")
+
+    @pytest.mark.asyncio
+    async def test_boolean_baseline_fetched_once(self, config):
+        """Test the boolean-based baseline is requested once per target"""
+        test = SQLInjectionTest(config, {})
+        test.make_request = AsyncMock(return_value=httpx.Response(200, content=b'ok'))
+        target = SQLiTarget(kind='form', url='https://example.com/login',
+                            base_url=urlparse('https://example.com/login'), method='POST',
+                            inputs=[{'name': 'user'}, {'name': 'pass'}])
+
+        await test._test_boolean_based(target.url, 'POST', target, None)
+
+        baseline_calls = [call for call in test.make_request.call_args_list
+                          if call.kwargs['data'] == {'user': 'normal', 'pass': 'normal'}]
+        assert len(baseline_calls) == 1
+        assert test.make_request.await_count == 1 + 5
+
+    def test_responses_differ_by_length(self, config):
+        """Test responses are compared by byte length and status"""
+        test = SQLInjectionTest(config, {})
+        small = httpx.Response(200, content=b'a' * 10)
+        large = httpx.Response(200, content=b'a' * 500)
+
+        assert test._responses_differ_significantly(small, large)
+        assert not test._responses_differ_significantly(small, httpx.Response(200, content=b'b' * 60))
+        assert test._responses_differ_significantly(small, httpx.Response(500, content=b'a' * 10))
+
+    @pytest.mark.asyncio
+    async def test_error_based_reports_first_hit(self, config):
+        """Test concurrent error-based probes report one finding and tolerate failures"""
+        test = SQLInjectionTest(config, {})
+
+        async def fake_request(url, method='GET', data=None, **kwargs):
+            if 'id=%27' in url:
+                return httpx.Response(500, content=b'You have an error in your SQL syntax near MySQL')
+            if 'q=%27' in url:
+                raise httpx.ConnectError('refused')
+            return httpx.Response(200, content=b'ok')
+
+        test.make_request = fake_request
+        target = SQLiTarget(kind='url_param', url='https://example.com/item?id=1&q=a',
+                            base_url=urlparse('https://example.com/item'), method='GET',
+                            params={'id': ['1'], 'q': ['a']})
+
+        await test._test_error_based(target.url, 'GET', target, None)
+
+        findings = test.test_result.findings
+        assert len(findings) == 1
+        assert findings[0].metadata['parameter'] == 'id'
+        assert findings[0].metadata['payload'] == "'"
+        assert target.params == {'id': ['1'], 'q': ['a']}
+
+    @pytest.mark.asyncio
+    async def test_union_based_stops_after_first_hit(self, config):
+        """Test UNION probes report only the first hit per target"""
+        test = SQLInjectionTest(config, {})
+        test.make_request = AsyncMock(return_value=httpx.Response(200, content=b'NULL'))
+        target = SQLiTarget(kind='url_param', url='https://example.com/item?id=1&q=a',
+                            base_url=urlparse('https://example.com/item'), method='GET',
+                            params={'id': ['1'], 'q': ['a']})
+
+        await test._test_union_based(target.url, 'GET', target, None)
+
+        findings = test.test_result.findings
+        assert len(findings) == 1
+        assert findings[0].metadata['parameter'] == 'id'
+
+    def test_deduplicate_targets(self, config):
+        """Test repeated forms and parameter sets collapse to one target"""
+        test = SQLInjectionTest(config, {})
+        login = SQLiTarget(kind='form', url='https://example.com/login', base_url=urlparse('https://example.com/login'),
+                           method='post', inputs=[{'name': 'user'}, {'name': 'pass'}])
+        item = SQLiTarget(kind='url_param', url='https://example.com/item?id=1', base_url=urlparse('https://example.com/item'),
+                          method='GET', params={'id': ['1']})
+        other_item = replace(item, url='https://example.com/item?id=2', params={'id': ['2']})
+
+        targets = test._deduplicate_targets([login, replace(login, method='POST'), item, other_item])
+
+        assert targets == [login, item]
+
+    @pytest.mark.asyncio
+    async def test_time_based_read_timeout_is_finding(self, config):
+        """Test a probe hitting the read ceiling is reported once"""
+        test = SQLInjectionTest(config, {})
+        test.make_request = AsyncMock(side_effect=httpx.ReadTimeout('timed out'))
+        target = SQLiTarget(kind='url_param', url='https://example.com/item?id=1&q=a',
+                            base_url=urlparse('https://example.com/item'), method='GET',
+                            params={'id': ['1'], 'q': ['a']})
+
+        await test._test_time_based(target.url, 'GET', target, None)
+
+        assert test.make_request.await_count == 1
+        assert test.make_request.call_args.kwargs['timeout'] is SQLInjectionTest.TIME_BASED_TIMEOUT
+        findings = test.test_result.findings
+        assert len(findings) == 1
+        assert findings[0].metadata['response_time'] == 6.0
+
+
+    @pytest.mark.asyncio
+    async def test_payload_url_keeps_query_before_fragment(self, config):
+        """Test payload URLs are rebuilt from the parsed base URL"""
+        test = SQLInjectionTest(config, {})
+        test.make_request = AsyncMock()
+        target = SQLiTarget(kind='api', url='https://example.com/app#/items',
+                            base_url=test._base_url(urlparse('https://example.com/app#/items')),
+                            method='GET', params={'id': 'test'})
+
+        await test._send_payload(target.url, 'GET', target, 'id', "'")
+
+        assert test.make_request.call_args.args[0] == 'https://example.com/app?id=%27'
+
+
+class TestCommandInjection:
+    """Test CommandInjectionTest probing"""
+
+    FORM = {'action': 'https://example.com/ping', 'method': 'post', 'inputs': [{'name': 'host'}]}
+
+    @pytest.mark.asyncio
+    async def test_time_based_read_timeout_is_finding(self, config):
+        """Test the sleep probe hitting the read ceiling is reported as a delay"""
+        payloads = []
+
+        def make_request(url, method, data, timeout):
+            payloads.append(data['host'])
+            if 'sleep' in data['host']:
+                raise httpx.ReadTimeout('timed out')
+            return httpx.Response(200, text='pong')
+
+        test = CommandInjectionTest(config, {})
+        test.make_request = AsyncMock(side_effect=make_request)
+
+        await test._test_command_injection(self.FORM, 'https://example.com', 'host')
+
+        assert payloads == CommandInjectionTest.PROBE_PAYLOADS
+        assert test.make_request.call_args.kwargs['timeout'] is CommandInjectionTest.TIME_BASED_TIMEOUT
+        findings = test.test_result.findings
+        assert len(findings) == 1
+        assert findings[0].title == 'Possible Command Injection (Time-based)'
+
+    @pytest.mark.asyncio
+    async def test_stops_after_command_output(self, config):
+        """Test echoed command output is reported once and the sleep probe is skipped"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text='www-data')
+
+        test = CommandInjectionTest(config, {}, client=_mock_client(handler))
+
+        await test._test_command_injection(self.FORM, 'https://example.com', 'host')
+
+        assert len(requests) == 1
+        assert [finding.severity.value for finding in test.test_result.findings] == ['critical']
+
+
+class TestSSLTLS:
+    """Test SSLTLSTest handshake inspection"""
+
+    @pytest.mark.asyncio
+    async def test_weak_tls_version_reported(self, config):
+        """Test an outdated negotiated protocol is reported"""
+        test = SSLTLSTest(config, {})
+        writer = MagicMock(wait_closed=AsyncMock())
+        writer.get_extra_info.return_value.version.return_value = 'TLSv1.1'
+
+        with patch('modules.security.tests.ssl_tls.asyncio.open_connection',
+                   AsyncMock(return_value=(MagicMock(), writer))) as open_connection:
+            await test.run_test(TestContext(target_url='https://example.com', base_url='https://example.com'))
+
+        assert open_connection.call_args.kwargs['server_hostname'] == 'example.com'
+        writer.close.assert_called_once()
+        writer.wait_closed.assert_awaited_once()
+        assert [f.title for f in test.test_result.findings] == ["Weak TLS Version"]
+
+
+class TestXSS:
+    """Test XSSTest response checks"""
+
+    def test_dom_xss_needs_source_and_sink(self, config):
+        """Test DOM XSS is flagged only when a source and a sink both appear"""
+        test = XSSTest(config, {})
+
+        assert test._check_dom_xss_patterns("el.innerHTML = location.hash;")
+        assert not test._check_dom_xss_patterns("el.innerHTML = 'static';")
+        assert not test._check_dom_xss_patterns("console.log(document.referrer);")
+        assert test._check_dom_xss_patterns("window.eval(window.location.search)")
+        assert not test._check_dom_xss_patterns("retrieval(relocationId); myFunction(locationName);")
+
+    @pytest.mark.asyncio
+    async def test_reflection_matches_payload_parts(self, config):
+        """Test partial reflection only counts fragments the payload carries"""
+        async def reflected(payload, body):
+            test = XSSTest(config, {}, client=_mock_client(lambda request: httpx.Response(200, content=body)))
+            async with test.stream_request('https://example.com') as response:
+                return await test.search_stream(response, *_reflection_pattern(payload)) is not None
+
+        payload = "<img src=x onerror=alert('XSS')>"
+
+        assert await reflected(payload, b"<IMG SRC=x ONERROR=foo>")
+        assert not await reflected(payload, b"<body onload=init()>")
+        assert not await reflected("'-confirm(1)-'", b"<script>alert(1)</script>")
+        assert await reflected("'-confirm(1)-'", b"x = ''-confirm(1)-'';")
+
+    @pytest.mark.asyncio
+    async def test_reflected_probes_cover_params_and_forms(self, config):
+        """Test every parameter and form gets each payload, and reflections are reported"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            reflected = parse_qs(request.content.decode()).get('comment', [''])[0]
+            return httpx.Response(200, html=f'<p>{reflected}</p>')
+
+        test = XSSTest(config, {'xss': {'test_types': ['reflected']}}, client=_mock_client(handler))
+        page = CrawledPage(url='https://example.com/post?id=1&q=a', status_code=200,
+                           forms=[{'action': 'https://example.com/comment', 'method': 'post',
+                                   'inputs': [{'name': 'comment'}]}])
+
+        await test.run_test(TestContext(target_url='https://example.com', base_url='https://example.com',
+                                        crawled_pages=[page]))
+
+        assert len(requests) == 5 * 2 + 5
+        findings = test.test_result.findings
+        assert len(findings) == 5
+        assert {f.metadata['parameter'] for f in findings} == {'comment'}
+
+    def test_url_prefixes_keep_other_params(self, config):
+        """Test each parameter's prefix carries the other parameters pre-encoded"""
+        prefixes = XSSTest._url_prefixes('https://example.com/p?id=1&q=a b', {'id': ['1'], 'q': ['a b']})
+
+        assert prefixes == {'id': 'https://example.com/p?q=a+b&', 'q': 'https://example.com/p?id=1&'}
+        assert XSSTest._url_prefixes('https://example.com/p?id=1', {'id': ['1']}) == {'id': 'https://example.com/p?'}
+
+    def test_deduplicate_targets(self, config):
+        """Test repeated forms and parameter sets collapse to one target"""
+        test = XSSTest(config, {})
+        search = {'type': 'form', 'url': 'https://example.com/search', 'method': 'get',
+                  'inputs': [{'name': 'q'}], 'input_names': ('q',)}
+        item = {'type': 'url_param', 'url': 'https://example.com/item?id=1', 'params': {'id': ['1']}}
+
+        targets = test._deduplicate_targets([
+            search, dict(search, method='GET'), item,
+            dict(item, url='https://example.com/item?id=2', params={'id': ['2']}),
+        ])
+
+        assert targets == [search, item]
+
+    @pytest.mark.asyncio
+    async def test_non_html_responses_not_scanned(self, config):
+        """Test reflections in non-HTML bodies are ignored but HTML error pages are not"""
+        target = {'type': 'url_param', 'url': 'https://example.com/p?q=a', 'params': {'q': ['a']},
+                  'url_prefixes': {'q': 'https://example.com/p?'}}
+        payload = "<script>alert('XSS')</script>"
+
+        test = XSSTest(config, {}, client=_mock_client(lambda request: httpx.Response(
+            200, content=payload.encode(), headers={'content-type': 'application/json'})))
+        await test._probe_xss(target, 'q', payload)
+        assert test.test_result.findings == []
+
+        test.client = _mock_client(lambda request: httpx.Response(
+            404, content=payload.encode(), headers={'content-type': 'text/html; charset=utf-8'}))
+        await test._probe_xss(target, 'q', payload)
+        assert len(test.test_result.findings) == 1
+
+    @pytest.mark.asyncio
+    async def test_stored_xss_matches_own_submission_only(self, config):
+        """Test stored XSS ignores existing scripts and reports the echoed tagged payload"""
+        test = XSSTest(config, {'xss': {'test_types': ['stored']}})
+        page = CrawledPage(url='https://example.com/guestbook', status_code=200,
+                           forms=[{'method': 'post', 'inputs': [{'name': 'msg', 'type': 'text'}]}])
+        context = TestContext(target_url='https://example.com', base_url='https://example.com', crawled_pages=[page])
+
+        test.make_request = AsyncMock(return_value=httpx.Response(200, html="<script>alert('Stored-XSS')</script>"))
+        await test.run_test(context)
+        assert test.test_result.findings == []
+
+        async def echo(url, method='GET', data=None, **kwargs):
+            return httpx.Response(200, html=f"<li>{data['msg']}</li>")
+
+        test.make_request = AsyncMock(side_effect=echo)
+        await test.run_test(context)
+        assert len(test.test_result.findings) == 1
+
+    @pytest.mark.asyncio
+    async def test_dom_xss_skips_pages_without_inline_js(self, config):
+        """Test only pages the crawler saw with inline JS are fetched for DOM XSS"""
+        test = XSSTest(config, {'xss': {'test_types': ['dom']}})
+        test.make_request = AsyncMock(return_value=httpx.Response(200, html='<p>ok</p>'))
+        pages = [
+            CrawledPage(url='https://example.com/static', status_code=200, has_inline_js=False),
+            CrawledPage(url='https://example.com/app', status_code=200, has_inline_js=True),
+        ]
+
+        await test.run_test(TestContext(target_url='https://example.com', base_url='https://example.com',
+                                        crawled_pages=pages))
+
+        test.make_request.assert_awaited_once_with('https://example.com/app')
+
+
+class TestXXE:
+    """Test XXETest probing"""
+
+    @pytest.mark.asyncio
+    async def test_stops_after_first_finding(self, config):
+        """Test a leaked entity is reported once and later payloads are skipped"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=b'<foo>root:x:0:0:root</foo>')
+
+        test = XXETest(config, {}, client=_mock_client(handler))
+
+        await test._test_xxe({'action': 'https://example.com/upload', 'method': 'post'}, 'https://example.com')
+
+        assert len(requests) == 1
+        assert len(test.test_result.findings) == 1
+
+    @pytest.mark.asyncio
+    async def test_candidate_selection(self, config):
+        """Test XML-ish forms and endpoints are probed and unnamed inputs are tolerated"""
+        test = XXETest(config, {})
+        test._test_xxe = AsyncMock()
+        page = CrawledPage(url='https://example.com', status_code=200, forms=[
+            {'action': 'https://example.com/search', 'inputs': [{'name': None, 'type': 'submit'}]},
+            {'action': 'https://example.com/import', 'inputs': [{'name': 'XML', 'type': 'text'}]},
+        ])
+        endpoints = [
+            ApiEndpoint(url='https://example.com/api/feed', method='POST', response_type='application/XML'),
+            ApiEndpoint(url='https://example.com/api/user', method='GET', response_type=None),
+        ]
+
+        await test.run_test(TestContext(target_url='https://example.com', base_url='https://example.com',
+                                        crawled_pages=[page], api_endpoints=endpoints))
+
+        assert [call.args[0]['action'] for call in test._test_xxe.call_args_list] == [
+            'https://example.com/import', 'https://example.com/api/feed'
+        ]
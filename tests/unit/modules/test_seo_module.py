@@ -0,0 +1,76 @@
+"""
+Unit tests for the SEO module
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+
+from core.config import ConfigManager
+from core.models import TestContext
+from modules.seo.seo_module import SEOModule
+
+
+def _run_on(html: str):
+    """Run the SEO module against a page served from the response cache"""
+    context = TestContext(
+        target_url='https://example.com',
+        base_url='https://example.com',
+        response_cache={'https://example.com': httpx.Response(200, text=html)}
+    )
+    return SEOModule(ConfigManager()).run(context)
+
+
+class TestSEOModule:
+    """Test SEOModule page checks"""
+
+    @pytest.mark.asyncio
+    async def test_well_formed_page_has_no_findings(self):
+        """Test a page meeting every check produces no findings"""
+        html = """<html><head>
+            <title>Example</title>
+            <meta name="description" content="An example page">
+            <meta name="viewport" content="width=device-width">
+            <link rel="alternate canonical" href="https://example.com">
+            <meta property="og:title" content="Example">
+            <script type="application/ld+json">{}</script>
+        </head><body><h1>Example</h1><img src="a.png" alt="A"></body></html>"""
+
+        result = await _run_on(html)
+
+        assert result.test_results[0].findings == []
+
+    @pytest.mark.asyncio
+    async def test_missing_tags_reported(self):
+        """Test missing and misused tags are each reported"""
+        html = """<html><head>
+            <title>{}</title>
+            <meta name="robots" content="NOINDEX">
+        </head><body><h1>A</h1><h1>B</h1><img src="a.png"><img src="b.png" alt=""></body></html>""".format('x' * 61)
+
+        result = await _run_on(html)
+
+        assert {f.title for f in result.test_results[0].findings} == {
+            "Title Too Long", "Missing Meta Description", "Missing Viewport Meta Tag",
+            "Multiple H1 Tags", "Images Missing Alt Text", "Missing Canonical URL",
+            "Missing Open Graph Tags", "No Structured Data", "Page Set to No-Index",
+        }
+
+    @pytest.mark.asyncio
+    async def test_empty_page_reports_missing_title(self):
+        """Test an empty body is treated as a page without tags"""
+        result = await _run_on('')
+
+        assert "Missing Title Tag" in {f.title for f in result.test_results[0].findings}
+
+    @pytest.mark.asyncio
+    async def test_uses_scan_client_on_cache_miss(self):
+        """Test the target is fetched with the scan's shared client when not crawled"""
+        client = MagicMock(get=AsyncMock(return_value=httpx.Response(200, text='<title>Example</title>')))
+        context = TestContext(target_url='https://example.com', base_url='https://example.com', http_client=client)
+
+        result = await SEOModule(ConfigManager()).run(context)
+
+        client.get.assert_awaited_once_with('https://example.com')
+        assert "Missing Title Tag" not in {f.title for f in result.test_results[0].findings}
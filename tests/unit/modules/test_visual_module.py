@@ -0,0 +1,94 @@
+"""
+Unit tests for the visual regression module
+"""
+
+import pytest
+from unittest.mock import patch
+
+import numpy as np
+from PIL import Image
+
+from core.config import ConfigManager
+from modules.visual.visual_module import VisualModule, _color_histogram, _histogram_distance
+
+
+def _save(path, pixels):
+    """Write an RGB array as a PNG and return its path"""
+    Image.fromarray(np.asarray(pixels, dtype=np.uint8)).save(path)
+    return str(path)
+
+
+@pytest.fixture
+def module():
+    """Visual module with default config"""
+    return VisualModule(ConfigManager())
+
+
+@pytest.fixture
+def gradient():
+    """Horizontal gradient screenshot stand-in"""
+    row = np.linspace(0, 255, 200, dtype=np.uint8)
+    return np.stack([np.tile(row, (120, 1))] * 3, axis=-1)
+
+
+class TestCompareScreenshots:
+    """Test VisualModule._compare_screenshots"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('mode', ['phash', 'pixel'])
+    async def test_identical_screenshots(self, module, gradient, tmp_path, mode):
+        """Test identical screenshots have no difference"""
+        baseline = _save(tmp_path / 'baseline.png', gradient)
+        current = _save(tmp_path / 'current.png', gradient)
+
+        assert await module._compare_screenshots(baseline, current, 0.1, mode) == 0.0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('mode', ['phash', 'pixel'])
+    async def test_changed_screenshot_exceeds_threshold(self, module, gradient, tmp_path, mode):
+        """Test a mirrored layout is reported above the threshold"""
+        baseline = _save(tmp_path / 'baseline.png', gradient)
+        current = _save(tmp_path / 'current.png', gradient[:, ::-1])
+
+        assert await module._compare_screenshots(baseline, current, 0.1, mode) > 0.1
+
+    @pytest.mark.asyncio
+    async def test_pixel_diff_stops_past_threshold(self, module, gradient, tmp_path):
+        """Test pixel mode stops diffing once the threshold is exceeded"""
+        baseline = _save(tmp_path / 'baseline.png', gradient)
+        current = _save(tmp_path / 'current.png', 255 - gradient)
+        module.DIFF_STRIPE_ROWS = 10
+
+        with patch.object(VisualModule, '_stripe_diff', wraps=VisualModule._stripe_diff) as stripe_diff:
+            difference = await module._compare_screenshots(baseline, current, 0.1, 'pixel')
+
+        assert difference > 0.1
+        assert stripe_diff.call_count < len(gradient) // 10
+
+    @pytest.mark.asyncio
+    async def test_identical_files_skip_decoding(self, module, gradient, tmp_path):
+        """Test byte-identical screenshots are not decoded"""
+        baseline = _save(tmp_path / 'baseline.png', gradient)
+        current = _save(tmp_path / 'current.png', gradient)
+
+        with patch('modules.visual.visual_module.Image.open') as image_open:
+            assert await module._compare_screenshots(baseline, current, 0.1, 'pixel') == 0.0
+
+        image_open.assert_not_called()
+
+
+class TestHistogramDistance:
+    """Test the colour histogram check"""
+
+    def test_same_colours_have_no_distance(self, gradient):
+        """Test identical colour distributions have distance 0"""
+        histogram = _color_histogram(Image.fromarray(gradient))
+
+        assert _histogram_distance(histogram, histogram) == pytest.approx(0.0, abs=1e-6)
+
+    def test_colour_shift_is_detected(self):
+        """Test a layout-identical colour change has maximal distance"""
+        red = _color_histogram(Image.new('RGB', (50, 50), (255, 0, 0)))
+        blue = _color_histogram(Image.new('RGB', (50, 50), (0, 0, 255)))
+
+        assert _histogram_distance(red, blue) > 0.5
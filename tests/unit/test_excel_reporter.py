@@ -0,0 +1,66 @@
+"""
+Unit tests for the Excel reporter
+"""
+
+import pytest
+from openpyxl import load_workbook
+
+from reporters.excel_reporter import ExcelReporter
+
+
+@pytest.fixture
+def scan_data():
+    """Scan data covering every worksheet"""
+    return {
+        'target': 'https://example.com',
+        'date': '2025-01-01',
+        'summary': {'total_issues': 3, 'critical': 1, 'high': 1, 'medium': 1, 'low': 0},
+        'vulnerabilities': [
+            {'severity': 'Critical', 'type': 'sqli', 'description': 'SQL injection in id',
+             'location': 'https://example.com/item?id=1', 'remediation': 'Use bound parameters'},
+            {'severity': 'High', 'type': 'xss', 'description': 'Reflected XSS'},
+            {'severity': 'Medium', 'type': 'headers', 'description': 'Missing CSP'},
+        ],
+        'security': {'score': 70, 'tests_performed': [
+            {'name': 'SQL Injection', 'status': 'failed', 'issues': 1, 'pass_rate': 50.0},
+        ]},
+        'performance': {'metrics': {'avg_response_time': 120}},
+        'seo': {'checks': [{'name': 'Title', 'status': 'Pass', 'issues': 0}]},
+    }
+
+
+class TestExcelReporter:
+    """Tests for ExcelReporter"""
+
+    @pytest.mark.parametrize('write_only_threshold', [500, 0])
+    def test_generates_all_sheets(self, scan_data, tmp_path, write_only_threshold):
+        """Test every section gets a worksheet with its rows, in normal and write-only mode"""
+        reporter = ExcelReporter(output_dir=str(tmp_path))
+        reporter.WRITE_ONLY_THRESHOLD = write_only_threshold
+        path = reporter.generate(scan_data, 'report.xlsx')
+
+        wb = load_workbook(path)
+        assert wb.sheetnames == ['Summary', 'Vulnerabilities', 'Security', 'Performance', 'SEO']
+
+        vulns = wb['Vulnerabilities']
+        assert [cell.value for cell in vulns[3]] == [
+            1, 'Critical', 'sqli', 'SQL injection in id',
+            'https://example.com/item?id=1', 'Use bound parameters'
+        ]
+        assert vulns['B3'].fill.start_color.rgb.endswith('DC143C')
+        assert vulns.max_row == 5
+        assert vulns['A2'].border.left.style == 'thin'
+        assert vulns['D3'].border.left.style == 'thin' and vulns['D3'].alignment.wrap_text
+        assert 'A1:F1' in vulns.merged_cells
+        series = wb['Summary']._charts[0].series[0]
+        assert [point.v for point in series.val.numRef.numCache.pt] == [1, 1, 1, 0]
+        assert [point.v for point in series.cat.strRef.strCache.pt] == ['Critical', 'High', 'Medium', 'Low']
+
+    def test_columns_sized_to_content(self, scan_data, tmp_path):
+        """Test auto-sized columns fit the widest value, capped at 50"""
+        scan_data['security']['tests_performed'][0]['name'] = 'x' * 80
+        path = ExcelReporter(output_dir=str(tmp_path)).generate(scan_data, 'report.xlsx')
+
+        wb = load_workbook(path)
+        assert wb['Summary'].column_dimensions['A'].width == len('Security Scan Report - Summary') + 2
+        assert wb['Security'].column_dimensions['A'].width == 50
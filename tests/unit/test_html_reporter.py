@@ -0,0 +1,57 @@
+"""
+Unit tests for the HTML reporter
+"""
+
+import pytest
+
+from core.config import ConfigManager
+from core.models import Category, Finding, ModuleResult, Severity
+from core.models import TestResult as ScanTestResult, TestStatus as Status
+from reporters import HTMLReporter
+
+
+@pytest.fixture
+def scan_result(sample_scan_result):
+    """Sample scan result with findings of two severities"""
+    test_result = ScanTestResult(name='xss', description='XSS', category=Category.SECURITY, status=Status.FAILED)
+    test_result.add_finding(Finding(
+        title='Reflected XSS', description='Payload reflected', severity=Severity.HIGH,
+        category=Category.SECURITY, url='https://example.com/?q=1', cwe_id='CWE-79'
+    ))
+    test_result.add_finding(Finding(
+        title='Missing CSP', description='No Content-Security-Policy header', severity=Severity.LOW,
+        category=Category.SECURITY
+    ))
+    module_result = ModuleResult(name='xss', category=Category.SECURITY, status=Status.PASSED)
+    module_result.add_test_result(test_result)
+    sample_scan_result.add_module_result(module_result)
+    return sample_scan_result
+
+
+class TestHTMLReporter:
+    """Tests for HTMLReporter"""
+
+    def test_findings_grouped_by_severity(self, scan_result, tmp_path):
+        """Test each finding is rendered under its severity heading"""
+        output_path = tmp_path / 'report.html'
+
+        HTMLReporter(ConfigManager()).generate(scan_result, str(output_path))
+
+        html = output_path.read_text(encoding='utf-8')
+        assert html.count('<div class="finding ') == 2
+        assert html.index('HIGH Severity (1)') < html.index('Reflected XSS') < html.index('LOW Severity (1)')
+        assert 'CWE: CWE-79' in html
+        assert 'URL: https://example.com/?q=1' in html
+        assert html.rstrip().endswith('</html>')
+
+    def test_finding_text_is_escaped(self, scan_result, tmp_path):
+        """Test page content captured in findings cannot inject markup"""
+        finding = scan_result.module_results[-1].test_results[0].findings[0]
+        finding.title = '<script>alert(1)</script>'
+        output_path = tmp_path / 'report.html'
+
+        HTMLReporter(ConfigManager()).generate(scan_result, str(output_path))
+
+        html = output_path.read_text(encoding='utf-8')
+        assert '<script>' not in html
+        assert '&lt;script&gt;alert(1)&lt;/script&gt;' in html
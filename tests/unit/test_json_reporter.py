@@ -0,0 +1,73 @@
+"""
+Unit tests for the JSON reporter
+"""
+
+import json
+import pytest
+from unittest.mock import patch
+
+from core.config import ConfigManager
+from core.models import Category, Finding, ModuleResult, Severity
+from core.models import TestResult as ScanTestResult, TestStatus as Status
+from reporters import JSONReporter, json_reporter
+
+
+@pytest.fixture
+def scan_result(sample_scan_result):
+    """Sample scan result with one finding"""
+    test_result = ScanTestResult(name='xss', description='XSS', category=Category.SECURITY, status=Status.FAILED)
+    test_result.add_finding(Finding(
+        title='Reflected XSS', description='Payload reflected', severity=Severity.HIGH,
+        category=Category.SECURITY, url='https://example.com/?q=1', metadata={'attempts': 3}
+    ))
+    module_result = ModuleResult(name='xss', category=Category.SECURITY, status=Status.PASSED)
+    module_result.add_test_result(test_result)
+    sample_scan_result.add_module_result(module_result)
+    return sample_scan_result
+
+
+class TestJSONReporter:
+    """Tests for JSONReporter"""
+
+    @pytest.mark.parametrize('pretty_print', [True, False])
+    def test_report_round_trips(self, scan_result, tmp_path, pretty_print):
+        """Test the written report matches the JSON form of the scan result"""
+        config = ConfigManager()
+        config.set('reporting.formats', {'json': {'pretty_print': pretty_print}})
+        output_path = tmp_path / 'report.json'
+
+        JSONReporter(config).generate(scan_result, str(output_path))
+
+        with open(output_path, encoding='utf-8') as f:
+            report = json.load(f)
+        assert report['module_results'][1]['test_results'][0]['findings'][0]['severity'] == 'high'
+        assert report['summary'] == scan_result.model_dump(mode='json')['summary']
+        assert ('\n  ' in output_path.read_text(encoding='utf-8')) == pretty_print
+
+    @pytest.mark.parametrize('pretty_print', [True, False])
+    def test_streamed_report_matches_json_dump(self, scan_result, tmp_path, pretty_print):
+        """Test the stdlib path writes exactly what json.dump of the whole report did"""
+        config = ConfigManager()
+        config.set('reporting.formats', {'json': {'pretty_print': pretty_print}})
+        output_path = tmp_path / 'report.json'
+
+        with patch.object(json_reporter, 'ORJSON_AVAILABLE', False):
+            JSONReporter(config).generate(scan_result, str(output_path))
+
+        expected = json.dumps(scan_result.model_dump(), indent=2 if pretty_print else None, default=str)
+        assert output_path.read_text(encoding='utf-8') == expected
+
+    @pytest.mark.parametrize('pretty_print', [True, False])
+    def test_streamed_report_matches_orjson_dump(self, scan_result, tmp_path, pretty_print):
+        """Test the orjson path writes exactly what one orjson.dumps of the report gives"""
+        orjson = pytest.importorskip('orjson')
+        config = ConfigManager()
+        config.set('reporting.formats', {'json': {'pretty_print': pretty_print}})
+        output_path = tmp_path / 'report.json'
+
+        JSONReporter(config).generate(scan_result, str(output_path))
+
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty_print:
+            options |= orjson.OPT_INDENT_2
+        assert output_path.read_bytes() == orjson.dumps(scan_result.model_dump(), default=str, option=options)
@@ -0,0 +1,117 @@
+"""
+Unit tests for the PDF reporter
+"""
+
+import pytest
+from pathlib import Path
+from reportlab.platypus import Preformatted
+
+from reporters.pdf_reporter import PDFReporter
+
+
+@pytest.fixture
+def scan_data():
+    """Scan data covering every report section"""
+    return {
+        'target': 'https://example.com:8443',
+        'date': '2025-01-01',
+        'summary': {'pages_scanned': 4, 'total_issues': 3, 'critical': 1, 'high': 1, 'medium': 1, 'low': 0},
+        'vulnerabilities': [
+            {'severity': 'Critical', 'type': 'sqli', 'description': 'SQL injection in id',
+             'location': 'https://example.com/item?id=1'},
+            {'severity': 'High', 'type': 'xss', 'description': 'Reflected XSS', 'location': '/search'},
+            {'severity': 'Medium', 'type': 'headers', 'description': 'Missing CSP', 'location': '/'},
+        ],
+        'security': {'score': 70, 'tests_performed': [
+            {'name': 'SQL Injection', 'status': 'failed', 'issues': 1},
+        ]},
+        'performance': {'metrics': {'avg_response_time': 120}},
+        'recommendations': [{'priority': 'High', 'title': 'Use bound parameters'}],
+    }
+
+
+class TestPDFReporter:
+    """Tests for PDFReporter"""
+
+    def test_generates_pdf(self, scan_data, tmp_path):
+        """Test a report with every section is written"""
+        path = PDFReporter(output_dir=str(tmp_path)).generate(scan_data, 'report.pdf')
+
+        with open(path, 'rb') as f:
+            assert f.read(5) == b'%PDF-'
+
+    def test_styles_shared_between_instances(self, tmp_path):
+        """Test paragraph and table styles are built once"""
+        first = PDFReporter(output_dir=str(tmp_path))
+        second = PDFReporter(output_dir=str(tmp_path))
+
+        assert first.styles is second.styles
+        assert first.table_styles is second.table_styles
+        assert first.styles['ColumnHeaderCritical'].backColor != first.styles['ColumnHeaderLow'].backColor
+
+    def test_vulnerability_rows(self, tmp_path):
+        """Test vulnerabilities are grouped by severity and only long descriptions are cut"""
+        reporter = PDFReporter(output_dir=str(tmp_path))
+        elements = reporter._create_vulnerabilities_section([
+            {'severity': 'Low', 'type': 'headers', 'description': 'Missing CSP'},
+            {'severity': 'Critical', 'type': 'sqli', 'description': 'x' * 80, 'location': '/item'},
+            {'severity': 'Info', 'type': 'banner', 'description': 'Server header'},
+        ])
+
+        listings = [element.lines for element in elements if isinstance(element, Preformatted)]
+        assert [line.split() for [line] in listings] == [
+            ['1', 'sqli', 'x' * 50 + '...', '/item'],
+            ['1', 'headers', 'Missing', 'CSP'],
+            ['1', 'banner', 'Server', 'header'],
+        ]
+
+    def test_lowercase_severities_listed(self, tmp_path):
+        """Test vulnerabilities shaped like main.py's scan data are all listed"""
+        reporter = PDFReporter(output_dir=str(tmp_path))
+        elements = reporter._create_vulnerabilities_section([
+            {'severity': 'high', 'type': 'security', 'description': 'Reflected XSS', 'location': None},
+            {'severity': 'critical', 'type': 'security', 'description': 'SQL injection', 'location': '/item'},
+            {'severity': 'high', 'type': 'security', 'description': 'Open redirect', 'location': '/go'},
+        ])
+
+        headings = [element.text for element in elements if getattr(element, 'text', '').endswith('issues)')]
+        assert headings == ['Critical Severity (1 issues)', 'High Severity (2 issues)']
+        assert sum(len(element.lines) for element in elements if isinstance(element, Preformatted)) == 3
+
+    def test_vulnerability_rows_capped_per_severity(self, tmp_path):
+        """Test long severity groups are cut off with a pointer to the full list"""
+        reporter = PDFReporter(output_dir=str(tmp_path))
+        reporter.MAX_ROWS_PER_SEVERITY = 2
+        elements = reporter._create_vulnerabilities_section(
+            [{'severity': 'High', 'type': 'xss', 'description': 'Reflected XSS'}] * 5
+        )
+
+        listing = next(element for element in elements if isinstance(element, Preformatted))
+        assert len(listing.lines) == 2
+        assert any('and 3 more high issues' in getattr(element, 'text', '') for element in elements)
+
+    @pytest.mark.parametrize('target,types,expected', [
+        ('https://example.com:8443/app', ['xss', 'sqli', 'xss'], 'example-com-8443-sqli-xss-'),
+        ('not a url', [], 'unknown-site-fullscan-'),
+    ])
+    def test_default_filename(self, scan_data, tmp_path, target, types, expected):
+        """Test the default filename is built from the site and vulnerability types"""
+        scan_data['target'] = target
+        scan_data['vulnerabilities'] = [{'severity': 'Low', 'type': vtype} for vtype in types]
+
+        path = PDFReporter(output_dir=str(tmp_path)).generate(scan_data)
+
+        assert Path(path).name.startswith(expected)
+
+    def test_key_findings_escaped(self, scan_data, tmp_path):
+        """Test key findings are listed in one paragraph with markup characters escaped"""
+        scan_data['key_findings'] = ['Login form posts over <http>', 'Cookies lack Secure & HttpOnly']
+        reporter = PDFReporter(output_dir=str(tmp_path))
+
+        bullets = [
+            element for element in reporter._create_executive_summary(scan_data)
+            if getattr(element, 'text', '').startswith('•')
+        ]
+
+        assert len(bullets) == 1
+        assert bullets[0].getPlainText() == '• Login form posts over <http>• Cookies lack Secure & HttpOnly'
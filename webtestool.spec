@@ -16,6 +16,7 @@ project_root = Path('.').absolute()
 datas = [
     ('config', 'config'),
     ('payloads', 'payloads'),
+    ('reporters/templates', 'reporters/templates'),
     ('README.md', '.'),
     ('AUTHENTICATION_GUIDE.md', '.'),
     ('DESKTOP_APP_BUILD.md', '.'),